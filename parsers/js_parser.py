@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import tree_sitter_javascript as tjs
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Node, Parser, Query, QueryCursor
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# One instance is created per match, so slots keep them dict-free.
+@dataclass(slots=True)
 class JSSymbol:
     id: str
     name: str
@@ -24,7 +27,7 @@ class JSSymbol:
     metadata: Dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class JSReference:
     source_id: str
     target_id: str
@@ -35,12 +38,48 @@ class JSReference:
     context: str = ""
 
 
+@lru_cache(maxsize=None)
+def _language() -> Language:
+    """The JavaScript grammar, loaded once per process and shared by all parsers."""
+    return Language(tjs.language())
+
+
+# One pattern per symbol kind; pattern order matches ``_match_handlers``.
+_QUERY = """
+(class_declaration name: (_)) @class
+[(function_declaration name: (_)) (method_definition name: (_))] @function
+(variable_declarator name: (_)) @variable
+"""
+
+
+@lru_cache(maxsize=32)
+def _query(source: str) -> Query:
+    """Compile a query once per process; a Query is immutable and safe to share.
+
+    Bounded so that subclasses generating query text cannot grow it without limit.
+    """
+    return Query(_language(), source)
+
+
+def clear_query_cache() -> None:
+    """Drop compiled queries, e.g. after editing ``JavaScriptParser.QUERY`` at runtime."""
+    _query.cache_clear()
+
+
 class JavaScriptParser:
     """Generic JavaScript parser collecting classes/functions."""
 
+    # Pattern order must match ``_match_handlers``.
+    QUERY = _QUERY
+
     def __init__(self) -> None:
-        self.language = Language(tjs.language())
+        self.language = _language()
         self.parser = Parser(self.language)
+        # Numeric field id spares child_by_field_name's per-call name lookup.
+        self._name_field = self.language.field_id_for_name('name')
+        # tree-sitter walks the tree in C; Python only sees the declarations.
+        self._query = _query(self.QUERY)
+        self._match_handlers = (self._register_class, self._register_function, self._register_variable)
         self.symbols: Dict[str, JSSymbol] = {}
         self.references: List[JSReference] = []
         self.current_file = ""
@@ -55,32 +94,26 @@ class JavaScriptParser:
             self.content = handle.read()
 
         tree = self.parser.parse(self.content)
-        self._traverse(tree.root_node)
+        self._extract_declarations(tree.root_node)
 
         return list(self.symbols.values()), list(self.references)
 
     # ------------------------------------------------------------------
-    # Traversal helpers
+    # Extraction helpers
     # ------------------------------------------------------------------
 
-    def _traverse(self, node: Node, parent_symbol: Optional[JSSymbol] = None) -> None:
-        current_symbol = parent_symbol
-
-        if node.type == 'class_declaration':
-            current_symbol = self._register_class(node)
-        elif node.type in {'function_declaration', 'method_definition', 'function'}:
-            current_symbol = self._register_function(node)
-        elif node.type == 'variable_declarator':
-            self._register_variable(node, parent_symbol)
-
-        for child in node.children:
-            self._traverse(child, current_symbol)
+    def _extract_declarations(self, root: Node) -> None:
+        handlers = self._match_handlers
+        for pattern_index, captures in QueryCursor(self._query).matches(root):
+            # Every pattern has exactly one capture: the declaration node.
+            for nodes in captures.values():
+                handlers[pattern_index](nodes[0])
 
     def _register_class(self, node: Node) -> Optional[JSSymbol]:
-        name_node = node.child_by_field_name('name')
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
             return None
-        class_name = self._text(name_node)
+        class_name = self._name(name_node)
         symbol_id = self._symbol_id('class', node)
         symbol = JSSymbol(
             id=symbol_id,
@@ -94,10 +127,10 @@ class JavaScriptParser:
         return symbol
 
     def _register_function(self, node: Node) -> Optional[JSSymbol]:
-        name_node = node.child_by_field_name('name')
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
             return None
-        func_name = self._text(name_node)
+        func_name = self._name(name_node)
         symbol_id = self._symbol_id('function', node)
         symbol = JSSymbol(
             id=symbol_id,
@@ -110,11 +143,11 @@ class JavaScriptParser:
         self.symbols[symbol_id] = symbol
         return symbol
 
-    def _register_variable(self, node: Node, parent_symbol: Optional[JSSymbol]) -> None:
-        name_node = node.child_by_field_name('name')
+    def _register_variable(self, node: Node) -> None:
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
             return
-        var_name = self._text(name_node)
+        var_name = self._name(name_node)
         symbol_id = self._symbol_id('variable', node)
         symbol = JSSymbol(
             id=symbol_id,
@@ -129,5 +162,9 @@ class JavaScriptParser:
     def _text(self, node: Node) -> str:
         return self.content[node.start_byte:node.end_byte].decode('utf-8', errors='ignore')
 
+    def _name(self, node: Node) -> str:
+        # Identifier names repeat heavily across files; share one copy of each.
+        return sys.intern(self._text(node))
+
     def _symbol_id(self, prefix: str, node: Node) -> str:
         return f"js_{prefix}_{node.start_point[0]}_{node.start_point[1]}"
@@ -41,8 +41,15 @@ class MetadataParser:
         relative_path = str(file_path.relative_to(root_path))
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            
+            # PHP class names are namespaced, so a file without a backslash
+            # cannot contain any reference worth decoding and scanning.
+            if b'\\' not in raw:
+                return
+            
+            data = json.loads(raw.decode('utf-8'))
                 
             # Special handling for authentication hooks
             if 'authentication.json' in str(file_path):
@@ -98,8 +105,8 @@ class MetadataParser:
         """Check if a string looks like a PHP class name."""
         if not isinstance(value, str):
             return False
-        # Check for PHP namespace pattern
-        return bool(self.php_class_pattern.match(value) and '\\' in value)
+        # Check for PHP namespace pattern (cheap literal test first)
+        return '\\' in value and bool(self.php_class_pattern.match(value))
     
     def save_to_database(self):
         """Save configuration references to the database."""
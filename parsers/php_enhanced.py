@@ -1,9 +1,9 @@
 """Enhanced PHP parser with Symbol Table support - Pass 1: Symbol Collection"""
 
 import os
-import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, Iterator, List, Optional, Any, Set
 from tree_sitter import Language, Parser, Node
 import tree_sitter_php
 import logging
@@ -12,32 +12,119 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.core.symbol_table import SymbolTable, Symbol, SymbolType
+from src.core.hashing import stable_hash, stable_hasher
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def php_language() -> Language:
+    """The PHP grammar, loaded once per process and shared by both passes"""
+    return Language(tree_sitter_php.language_php())
+
+
+@lru_cache(maxsize=None)
+def _node_kind_ids(node_type: str) -> List[int]:
+    """Every named kind id the PHP grammar uses for ``node_type`` (aliases included)"""
+    language = php_language()
+    return [
+        kind_id for kind_id in range(language.node_kind_count)
+        if language.node_kind_is_named(kind_id) and language.node_kind_for_id(kind_id) == node_type
+    ]
+
+
+def _by_kind_id(handlers: Dict[str, Any]) -> Dict[int, Any]:
+    """Re-key a node type -> value table by kind id"""
+    return {
+        kind_id: value
+        for node_type, value in handlers.items()
+        for kind_id in _node_kind_ids(node_type)
+    }
+
+
+# Node-type sets consulted per child while walking; shared by both passes.
+NAME_NODE_TYPES = frozenset({'name', 'qualified_name'})
+PARAMETER_NODE_TYPES = frozenset({'simple_parameter', 'variadic_parameter', 'property_promotion_parameter'})
+
+# Symbol id prefixes, looked up by symbol type or, failing that, node type.
+_ID_PREFIX_BY_SYMBOL_TYPE = {
+    SymbolType.CLASS: "php_class_",
+    SymbolType.INTERFACE: "php_interface_",
+    SymbolType.TRAIT: "php_trait_",
+    SymbolType.FUNCTION: "php_function_",
+    SymbolType.METHOD: "php_method_",
+    SymbolType.PROPERTY: "php_property_",
+    SymbolType.CONSTANT: "php_constant_",
+    SymbolType.NAMESPACE: "php_namespace_",
+    SymbolType.IMPORT: "php_import_",
+}
+_ID_PREFIX_BY_NODE_TYPE = {
+    'class_declaration': "php_class_",
+    'interface_declaration': "php_interface_",
+    'trait_declaration': "php_trait_",
+    'function_definition': "php_function_",
+    'method_declaration': "php_method_",
+    'property_declaration': "php_property_",
+    'const_declaration': "php_constant_",
+    'namespace_definition': "php_namespace_",
+    'namespace_use_clause': "php_import_",
+    'enum_declaration': "php_enum_",
+}
+
+
 class PHPSymbolCollector:
     """Pass 1: Collects all symbol definitions from PHP files"""
     
-    def __init__(self, symbol_table: SymbolTable):
+    def __init__(self, symbol_table: Optional[SymbolTable]):
+        # None builds a collector for collect_symbols() only, e.g. in a worker
         self.symbol_table = symbol_table
-        PHP_LANGUAGE = Language(tree_sitter_php.language_php())
-        self.parser = Parser(PHP_LANGUAGE)
+        self.parser = Parser(php_language())
+        # Field ids for the per-parameter lookups: type, name, default value
+        field_id = php_language().field_id_for_name
+        self._parameter_fields = (field_id('type'), field_id('name'), field_id('default_value'))
         
         # Track current context during traversal
         self.current_file = None
+        self.content = b""
+        self._id_hasher = stable_hasher()
+        # Symbols produced by the handlers, handed out as the walk proceeds
+        self._pending_symbols: List[Symbol] = []
         self.current_namespace = None
+        self._namespace_prefix = ""
         self.current_class = None
         self.current_function = None
         self.imports = {}
         self.use_statements = {}
+        
+        # Node kind id -> handler, so each visited node costs one dict lookup on
+        # an int rather than building and hashing its type string.
+        # Context statements update file state; their children are still walked.
+        self._context_handlers = _by_kind_id({
+            'namespace_definition': self._handle_namespace,
+            'namespace_use_declaration': self._handle_use_statement,
+        })
+        # Containers are handled, then only their body node is walked under them.
+        # Values are (handler, body kind ids, whether the container is a class).
+        self._container_handlers = _by_kind_id({
+            'class_declaration': (self._handle_class, _node_kind_ids('declaration_list'), True),
+            'interface_declaration': (self._handle_interface, _node_kind_ids('declaration_list'), False),
+            'trait_declaration': (self._handle_trait, _node_kind_ids('declaration_list'), False),
+            'enum_declaration': (self._handle_enum, _node_kind_ids('enum_declaration_list'), False),
+        })
+        # Members are handled without descending into them.
+        self._member_handlers = _by_kind_id({
+            'function_definition': self._handle_function,
+            'method_declaration': self._handle_method,
+            'property_declaration': self._handle_property,
+            'const_declaration': self._handle_constant,
+        })
     
     def parse_file(self, file_path: str) -> None:
         """Parse a PHP file and collect all symbols"""
         # Check if file needs parsing
         with open(file_path, 'rb') as f:
             content = f.read()
-            file_hash = hashlib.md5(content).hexdigest()
+            file_hash = stable_hash(content)
         
         if not self.symbol_table.needs_parsing(file_path, file_hash):
             logger.debug(f"Skipping {file_path} - already parsed")
@@ -48,17 +135,6 @@ class PHPSymbolCollector:
         # Clear old symbols from this file
         self.symbol_table.clear_file_symbols(file_path)
         
-        # Reset context
-        self.current_file = file_path
-        self.current_namespace = None
-        self.current_class = None
-        self.current_function = None
-        self.imports = {}
-        self.use_statements = {}
-        
-        # Parse the file
-        tree = self.parser.parse(content)
-        
         # Use a single transaction for the whole file
         try:
             self.symbol_table.begin_transaction()
@@ -67,8 +143,8 @@ class PHPSymbolCollector:
             pass
         
         try:
-            # Traverse and collect symbols
-            self._traverse(tree.root_node)
+            # Stream symbols straight into one batched write
+            self.symbol_table.add_symbols(self.iter_symbols(file_path, content))
             
             # Update file hash
             self.symbol_table.update_file_hash(file_path, file_hash)
@@ -81,76 +157,101 @@ class PHPSymbolCollector:
             self.symbol_table.rollback()
             raise
     
-    def _traverse(self, node: Node, parent_symbol_id: Optional[str] = None) -> None:
-        """Traverse the AST and collect symbols"""
-        
-        if node.type == 'namespace_definition':
-            self._handle_namespace(node)
-        
-        elif node.type == 'namespace_use_declaration':
-            self._handle_use_statement(node)
-        
-        elif node.type == 'class_declaration':
-            symbol_id = self._handle_class(node, parent_symbol_id)
-            # Traverse class body with class as parent
-            for child in node.children:
-                if child.type == 'declaration_list':
-                    old_class = self.current_class
-                    self.current_class = self._get_node_text(node.child_by_field_name('name'))
-                    self._traverse(child, symbol_id)
-                    self.current_class = old_class
-            return  # Don't traverse children again
-        
-        elif node.type == 'interface_declaration':
-            symbol_id = self._handle_interface(node, parent_symbol_id)
-            # Traverse interface body
-            for child in node.children:
-                if child.type == 'declaration_list':
-                    self._traverse(child, symbol_id)
-            return
-        
-        elif node.type == 'trait_declaration':
-            symbol_id = self._handle_trait(node, parent_symbol_id)
-            # Traverse trait body
-            for child in node.children:
-                if child.type == 'declaration_list':
-                    self._traverse(child, symbol_id)
-            return
+    def collect_symbols(self, file_path: str, content: bytes) -> List[Symbol]:
+        """Parse ``content`` as ``file_path`` and return its symbols
         
-        elif node.type == 'function_definition':
-            symbol_id = self._handle_function(node, parent_symbol_id)
-            # Don't traverse function body in Pass 1
-            return
-        
-        elif node.type == 'method_declaration':
-            symbol_id = self._handle_method(node, parent_symbol_id)
-            # Don't traverse method body in Pass 1
-            return
-        
-        elif node.type == 'property_declaration':
-            self._handle_property(node, parent_symbol_id)
-            return
+        Touches no database state, so worker processes can run it and leave
+        the writes to the process that owns the symbol table.
+        """
+        return list(self.iter_symbols(file_path, content))
+    
+    def iter_symbols(self, file_path: str, content: bytes) -> Iterator[Symbol]:
+        """Parse ``content`` as ``file_path`` and yield its symbols as they are found
         
-        elif node.type == 'const_declaration':
-            self._handle_constant(node, parent_symbol_id)
-            return
+        Symbols come out in document order while the walk is still running, so
+        a consumer such as ``SymbolTable.add_symbols`` never holds a whole
+        file's worth of them at once.
+        """
+        # Reset context
+        self.current_file = file_path
+        self.content = content
+        # Every id in this file starts with the path; hash that part once.
+        self._id_hasher = stable_hasher(f"{file_path}:")
+        self.current_namespace = None
+        self._namespace_prefix = ""
+        self.current_class = None
+        self.current_function = None
+        self.imports = {}
+        self.use_statements = {}
         
-        elif node.type == 'enum_declaration':
-            symbol_id = self._handle_enum(node, parent_symbol_id)
-            for child in node.children:
-                if child.type == 'enum_declaration_list':
-                    self._traverse(child, symbol_id)
-            return
+        # Parse the file and traverse it
+        tree = self.parser.parse(content)
+        self._pending_symbols = []
+        try:
+            yield from self._traverse(tree.root_node)
+        finally:
+            self._pending_symbols = []
+    
+    def _traverse(self, node: Node, parent_symbol_id: Optional[str] = None) -> Iterator[Symbol]:
+        """Traverse the AST and yield symbols
+        
+        Walks an explicit stack in document order instead of recursing, so deeply
+        nested files cannot hit the recursion limit. Each entry carries the
+        parent symbol id and the enclosing class name in effect for its node.
+        Handlers append to ``_pending_symbols``, which is drained before each
+        node is visited.
+        """
+        pending = self._pending_symbols
+        outer_class = self.current_class
+        stack = [(node, parent_symbol_id, outer_class)]
+        
+        while stack:
+            if pending:
+                yield from pending
+                pending.clear()
+            
+            node, parent_symbol_id, self.current_class = stack.pop()
+            kind_id = node.kind_id
+            
+            member_handler = self._member_handlers.get(kind_id)
+            if member_handler is not None:
+                # Don't traverse member bodies in Pass 1
+                member_handler(node, parent_symbol_id)
+                continue
+            
+            # Children to visit next, with the parent and class they run under
+            children = node.children
+            child_parent_id = parent_symbol_id
+            child_class = self.current_class
+            
+            container = self._container_handlers.get(kind_id)
+            if container is not None:
+                handler, body_kind_ids, is_class = container
+                child_parent_id = handler(node, parent_symbol_id)
+                # Only the body is traversed, with the container as parent
+                children = [child for child in children if child.kind_id in body_kind_ids]
+                if children and is_class:
+                    child_class = self._get_node_text(node.child_by_field_name('name'))
+            
+            else:
+                context_handler = self._context_handlers.get(kind_id)
+                if context_handler is not None:
+                    context_handler(node)
+            
+            # Reversed so the leftmost child is popped first
+            stack.extend((child, child_parent_id, child_class) for child in reversed(children))
         
-        # Traverse children
-        for child in node.children:
-            self._traverse(child, parent_symbol_id)
+        yield from pending
+        pending.clear()
+        self.current_class = outer_class
     
     def _handle_namespace(self, node: Node) -> None:
         """Handle namespace declaration"""
         name_node = node.child_by_field_name('name')
         if name_node:
             self.current_namespace = self._get_node_text(name_node)
+            # Qualified names of every declaration below start with this
+            self._namespace_prefix = self.current_namespace + '\\'
             
             # Add namespace as a symbol
             symbol = Symbol(
@@ -162,7 +263,7 @@ class PHPSymbolCollector:
                 column_number=node.start_point[1],
                 namespace=None,  # Namespaces don't have a parent namespace
             )
-            self.symbol_table.add_symbol(symbol)
+            self._pending_symbols.append(symbol)
     
     def _handle_use_statement(self, node: Node) -> None:
         """Handle use/import statement"""
@@ -189,7 +290,7 @@ class PHPSymbolCollector:
                         namespace=self.current_namespace,
                         metadata={'imported_name': full_name}
                     )
-                    self.symbol_table.add_symbol(symbol)
+                    self._pending_symbols.append(symbol)
     
     def _handle_class(self, node: Node, parent_id: Optional[str]) -> str:
         """Handle class declaration"""
@@ -200,38 +301,40 @@ class PHPSymbolCollector:
         class_name = self._get_node_text(name_node)
         full_name = self._get_full_name(class_name)
         
-        # Get modifiers
+        # Modifiers, base clause and interfaces, in one pass over the children.
+        # Most classes implement nothing, so that list is only built on demand.
         is_abstract = False
         is_final = False
+        base_clause = None
+        implements = None
         for child in node.children:
-            if child.type == 'abstract_modifier':
+            child_type = child.type
+            if child_type == 'abstract_modifier':
                 is_abstract = True
-            elif child.type == 'final_modifier':
+            elif child_type == 'final_modifier':
                 is_final = True
+            elif child_type == 'base_clause':
+                base_clause = base_clause or child
+            elif child_type == 'class_interface_clause':
+                names = [
+                    self._get_node_text(interface)
+                    for interface in child.children
+                    if interface.type in NAME_NODE_TYPES
+                ]
+                implements = implements + names if implements else names
         
         # Get extends (try both field names for compatibility)
         extends = None
         extends_node = node.child_by_field_name('superclass')  # Older versions
-        if not extends_node:
-            # Newer versions use base_clause
-            for child in node.children:
-                if child.type == 'base_clause':
-                    # Extract the actual class name from "extends ClassName"
-                    for base_child in child.children:
-                        if base_child.type in ['name', 'qualified_name']:
-                            extends_node = base_child
-                            break
+        if not extends_node and base_clause is not None:
+            # Newer versions use base_clause: "extends ClassName"
+            for base_child in base_clause.children:
+                if base_child.type in NAME_NODE_TYPES:
+                    extends_node = base_child
+                    break
         if extends_node:
             extends = self._get_node_text(extends_node)
         
-        # Get implements
-        implements = []
-        for child in node.children:
-            if child.type == 'class_interface_clause':
-                for interface in child.children:
-                    if interface.type == 'name' or interface.type == 'qualified_name':
-                        implements.append(self._get_node_text(interface))
-        
         # Create symbol
         symbol = Symbol(
             id=self._generate_id(node, SymbolType.CLASS),
@@ -248,7 +351,7 @@ class PHPSymbolCollector:
             implements=implements or None
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _handle_interface(self, node: Node, parent_id: Optional[str]) -> str:
@@ -280,7 +383,7 @@ class PHPSymbolCollector:
             implements=extends or None  # Store extends in implements field
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _handle_trait(self, node: Node, parent_id: Optional[str]) -> str:
@@ -303,7 +406,7 @@ class PHPSymbolCollector:
             parent_id=parent_id
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _handle_function(self, node: Node, parent_id: Optional[str]) -> str:
@@ -339,7 +442,7 @@ class PHPSymbolCollector:
             parameters=parameters
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _handle_method(self, node: Node, parent_id: Optional[str]) -> str:
@@ -394,7 +497,7 @@ class PHPSymbolCollector:
             parameters=parameters
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _handle_property(self, node: Node, parent_id: Optional[str]) -> None:
@@ -436,7 +539,7 @@ class PHPSymbolCollector:
                         return_type=type_hint  # Store type in return_type field
                     )
                     
-                    self.symbol_table.add_symbol(symbol)
+                    self._pending_symbols.append(symbol)
     
     def _handle_constant(self, node: Node, parent_id: Optional[str]) -> None:
         """Handle constant declaration"""
@@ -471,7 +574,7 @@ class PHPSymbolCollector:
                         visibility=visibility if parent_id else None  # Only class constants have visibility
                     )
                     
-                    self.symbol_table.add_symbol(symbol)
+                    self._pending_symbols.append(symbol)
     
     def _handle_enum(self, node: Node, parent_id: Optional[str]) -> str:
         """Handle enum declaration (PHP 8.1+)"""
@@ -503,7 +606,7 @@ class PHPSymbolCollector:
             metadata={'is_enum': True, 'backing_type': backing_type}
         )
         
-        self.symbol_table.add_symbol(symbol)
+        self._pending_symbols.append(symbol)
         return symbol.id
     
     def _extract_parameters(self, params_node: Node) -> List[Dict[str, Any]]:
@@ -512,27 +615,28 @@ class PHPSymbolCollector:
             return []
         
         parameters = []
+        type_field, name_field, default_field = self._parameter_fields
         for child in params_node.children:
-            if child.type in ['simple_parameter', 'variadic_parameter', 
-                              'property_promotion_parameter']:
+            child_type = child.type
+            if child_type in PARAMETER_NODE_TYPES:
                 param = {}
                 
                 # Get type
-                type_node = child.child_by_field_name('type')
+                type_node = child.child_by_field_id(type_field)
                 if type_node:
                     param['type'] = self._get_node_text(type_node)
                 
                 # Get name
-                name_node = child.child_by_field_name('name')
+                name_node = child.child_by_field_id(name_field)
                 if name_node:
                     param['name'] = self._get_node_text(name_node).lstrip('$')
                 
                 # Check if optional (has default value)
-                default_node = child.child_by_field_name('default')
+                default_node = child.child_by_field_id(default_field)
                 param['optional'] = default_node is not None
                 
                 # Check if variadic
-                param['variadic'] = child.type == 'variadic_parameter'
+                param['variadic'] = child_type == 'variadic_parameter'
                 
                 # Check if reference
                 param['by_reference'] = False
@@ -547,80 +651,47 @@ class PHPSymbolCollector:
     
     def _get_full_name(self, name: str) -> str:
         """Get the fully qualified name including namespace"""
-        if self.current_namespace and not name.startswith('\\'):
-            return f"{self.current_namespace}\\{name}"
-        return name.lstrip('\\')
+        if name.startswith('\\'):
+            return name.lstrip('\\')
+        return self._namespace_prefix + name
     
     def _get_node_text(self, node: Node) -> str:
-        """Get the text content of a node"""
+        """Get the text content of a node, interned.
+
+        Only names, type hints and modifiers are read this way, and the same
+        few strings recur across every file of a project.
+        """
         if not node:
             return ""
         
-        with open(self.current_file, 'rb') as f:
-            content = f.read()
-            return content[node.start_byte:node.end_byte].decode('utf-8')
+        return sys.intern(self.content[node.start_byte:node.end_byte].decode('utf-8'))
     
     def _generate_id(self, node: Node, symbol_type: SymbolType = None) -> str:
         """Generate a unique ID for a symbol with proper prefix"""
-        # Determine prefix based on node type
-        prefix = ""
+        # Determine prefix from the symbol type, else from the node type
+        node_type = node.type
         if symbol_type:
-            if symbol_type == SymbolType.CLASS:
-                prefix = "php_class_"
-            elif symbol_type == SymbolType.INTERFACE:
-                prefix = "php_interface_"
-            elif symbol_type == SymbolType.TRAIT:
-                prefix = "php_trait_"
-            elif symbol_type == SymbolType.FUNCTION:
-                prefix = "php_function_"
-            elif symbol_type == SymbolType.METHOD:
-                prefix = "php_method_"
-            elif symbol_type == SymbolType.PROPERTY:
-                prefix = "php_property_"
-            elif symbol_type == SymbolType.CONSTANT:
-                prefix = "php_constant_"
-            elif symbol_type == SymbolType.NAMESPACE:
-                prefix = "php_namespace_"
-            elif symbol_type == SymbolType.IMPORT:
-                prefix = "php_import_"
-            elif symbol_type == SymbolType.ENUM:
-                prefix = "php_enum_"
+            prefix = _ID_PREFIX_BY_SYMBOL_TYPE.get(symbol_type, "")
         else:
-            # Fallback based on node.type
-            if node.type == 'class_declaration':
-                prefix = "php_class_"
-            elif node.type == 'interface_declaration':
-                prefix = "php_interface_"
-            elif node.type == 'trait_declaration':
-                prefix = "php_trait_"
-            elif node.type == 'function_definition':
-                prefix = "php_function_"
-            elif node.type == 'method_declaration':
-                prefix = "php_method_"
-            elif node.type == 'property_declaration':
-                prefix = "php_property_"
-            elif node.type == 'const_declaration':
-                prefix = "php_constant_"
-            elif node.type == 'namespace_definition':
-                prefix = "php_namespace_"
-            elif node.type == 'namespace_use_clause':
-                prefix = "php_import_"
-            elif node.type == 'enum_declaration':
-                prefix = "php_enum_"
-                
-        id_string = f"{self.current_file}:{node.start_point[0]}:{node.start_point[1]}:{node.type}"
-        return prefix + hashlib.md5(id_string.encode()).hexdigest()
+            prefix = _ID_PREFIX_BY_NODE_TYPE.get(node_type, "")
+        
+        hasher = self._id_hasher.copy()
+        hasher.update(f"{node.start_point[0]}:{node.start_point[1]}:{node_type}".encode())
+        return prefix + hasher.hexdigest()
     
     def parse_directory(self, directory: str, extensions: List[str] = None) -> None:
         """Parse all PHP files in a directory"""
         if extensions is None:
             extensions = ['.php']
         
-        path = Path(directory)
-        files = []
-        
-        for ext in extensions:
-            files.extend(path.rglob(f'*{ext}'))
+        # Single walk matching every extension at once
+        suffixes = tuple(extensions)
+        files = [
+            Path(root, name)
+            for root, _dirs, names in os.walk(directory)
+            for name in names
+            if name.endswith(suffixes)
+        ]
         
         total = len(files)
         for i, file_path in enumerate(files, 1):
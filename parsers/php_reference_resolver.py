@@ -1,11 +1,10 @@
 """PHP Reference Resolver - Pass 2: Resolve all references using Symbol Table"""
 
 import os
-import hashlib
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
-from tree_sitter import Language, Parser, Node
-import tree_sitter_php
+from tree_sitter import Parser, Node
 import logging
 
 import sys
@@ -13,9 +12,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.core.symbol_table import SymbolTable, Symbol, SymbolType
 from src.core.resolution import SymbolResolver, ResolutionContext
+from src.core.hashing import file_symbol_id, stable_hash
+from parsers.php_enhanced import NAME_NODE_TYPES, PARAMETER_NODE_TYPES, php_language
 
 logger = logging.getLogger(__name__)
 
+_CLASS_LIKE_TYPES = frozenset({SymbolType.CLASS, SymbolType.INTERFACE, SymbolType.TRAIT})
+_MEMBER_TYPES = frozenset({SymbolType.METHOD, SymbolType.PROPERTY, SymbolType.CONSTANT})
+
+# Primitive type hints never resolve to a symbol in the table.
+_PRIMITIVE_TYPES = frozenset({
+    'string', 'int', 'float', 'bool', 'array', 'object', 'void', 'mixed', 'never', 'null',
+    'false', 'true', 'callable', 'iterable', 'resource',
+})
+
 
 class PHPReferenceResolver:
     """Pass 2: Resolves all references using the populated symbol table"""
@@ -23,13 +33,20 @@ class PHPReferenceResolver:
     def __init__(self, symbol_table: SymbolTable):
         self.symbol_table = symbol_table
         self.resolver = SymbolResolver(symbol_table)
-        PHP_LANGUAGE = Language(tree_sitter_php.language_php())
-        self.parser = Parser(PHP_LANGUAGE)
+        self.parser = Parser(php_language())
         
         # Track context during traversal
         self.context = None
         self.current_symbol_stack = []  # Stack of symbol IDs we're inside
         
+        # External/unresolved symbols by name; the same parent or exception
+        # class is referenced from many files
+        self._external_symbols: Dict[str, Symbol] = {}
+        
+        # Current file's symbols by (line, column, type), built once per file
+        self._symbols_at: Dict[Tuple[int, int, SymbolType], Symbol] = {}
+        self._file_main_symbol: Optional[Symbol] = None
+        
     def resolve_file(self, file_path: str) -> None:
         """Resolve all references in a PHP file"""
         logger.info(f"Resolving references in {file_path}")
@@ -47,6 +64,13 @@ class PHPReferenceResolver:
             use_statements={}
         )
         
+        # Index symbols by position so each declaration lookup is O(1);
+        # the first symbol at a position wins, as with a linear scan
+        self._symbols_at = {}
+        for symbol in file_symbols:
+            self._symbols_at.setdefault((symbol.line_number, symbol.column_number, symbol.type), symbol)
+        self._file_main_symbol = self._select_main_symbol(file_symbols)
+        
         # Build imports map from file symbols
         for symbol in file_symbols:
             if symbol.type == SymbolType.NAMESPACE:
@@ -86,14 +110,11 @@ class PHPReferenceResolver:
     
     def _create_file_defines_relationships(self, file_path: str, file_symbols: List[Symbol]) -> None:
         """Create DEFINES relationships from File to Classes/Interfaces/Traits"""
-        import hashlib
-        
-        # Generate file ID
-        file_id = f"file_{hashlib.md5(file_path.encode()).hexdigest()}"
+        file_id = file_symbol_id(file_path)
         
         # Create DEFINES relationships for top-level classes, interfaces, and traits
         for symbol in file_symbols:
-            if symbol.type in [SymbolType.CLASS, SymbolType.INTERFACE, SymbolType.TRAIT]:
+            if symbol.type in _CLASS_LIKE_TYPES:
                 # Only create DEFINES for top-level (no parent_id) or symbols whose parent is a namespace
                 if not symbol.parent_id or self._is_namespace_symbol(symbol.parent_id):
                     self.symbol_table.add_reference(
@@ -109,19 +130,17 @@ class PHPReferenceResolver:
     def _create_class_defines_relationships(self, file_symbols: List[Symbol]) -> None:
         """Create DEFINES relationships from Classes to their Methods and Properties"""
         # Group symbols by their parent_id for efficient lookup
-        symbols_by_parent = {}
+        symbols_by_parent: Dict[str, List[Symbol]] = defaultdict(list)
         for symbol in file_symbols:
             if symbol.parent_id:
-                if symbol.parent_id not in symbols_by_parent:
-                    symbols_by_parent[symbol.parent_id] = []
                 symbols_by_parent[symbol.parent_id].append(symbol)
         
         # For each class/interface/trait, create DEFINES relationships to its members
         for symbol in file_symbols:
-            if symbol.type in [SymbolType.CLASS, SymbolType.INTERFACE, SymbolType.TRAIT]:
-                members = symbols_by_parent.get(symbol.id, [])
+            if symbol.type in _CLASS_LIKE_TYPES:
+                members = symbols_by_parent.get(symbol.id, ())
                 for member in members:
-                    if member.type in [SymbolType.METHOD, SymbolType.PROPERTY, SymbolType.CONSTANT]:
+                    if member.type in _MEMBER_TYPES:
                         self.symbol_table.add_reference(
                             source_id=symbol.id,
                             target_id=member.id,
@@ -155,7 +174,7 @@ class PHPReferenceResolver:
         if node.type == 'namespace_definition':
             name_node = node.child_by_field_name('name')
             if name_node:
-                self.context.current_namespace = self._get_node_text(name_node, content)
+                self.context.current_namespace = self._name(name_node, content)
         
         elif node.type == 'namespace_use_declaration':
             logger.debug(f"Found namespace_use_declaration at line {node.start_point[0] + 1}")
@@ -169,7 +188,7 @@ class PHPReferenceResolver:
                     alias_node = None
                     
                     for clause_child in child.children:
-                        if clause_child.type in ['name', 'qualified_name']:
+                        if clause_child.type in NAME_NODE_TYPES:
                             name_node = clause_child
                         elif clause_child.type == 'namespace_aliasing_clause':
                             # Handle alias
@@ -180,8 +199,8 @@ class PHPReferenceResolver:
                     logger.debug(f"  name_node: {name_node}, alias_node: {alias_node}")
                     
                     if name_node:
-                        imported_name = self._get_node_text(name_node, content)
-                        alias = self._get_node_text(alias_node, content) if alias_node else imported_name.split('\\')[-1]
+                        imported_name = self._name(name_node, content)
+                        alias = self._name(alias_node, content) if alias_node else sys.intern(imported_name.split('\\')[-1])
                         logger.debug(f"  Importing: {imported_name}")
                         
                         # Find the source file symbol to attach the import to
@@ -227,7 +246,7 @@ class PHPReferenceResolver:
                         for child in node.children:
                             if child.type == 'base_clause':
                                 for base_child in child.children:
-                                    if base_child.type in ['name', 'qualified_name']:
+                                    if base_child.type in NAME_NODE_TYPES:
                                         extends_node = base_child
                                         break
                     if extends_node:
@@ -237,7 +256,7 @@ class PHPReferenceResolver:
                     for child in node.children:
                         if child.type == 'class_interface_clause':
                             for interface in child.children:
-                                if interface.type in ['name', 'qualified_name']:
+                                if interface.type in NAME_NODE_TYPES:
                                     self._resolve_type_reference(interface, content, class_symbol.id, 'IMPLEMENTS')
                     
                     # FIXED: Pass class_symbol as parent to children
@@ -322,7 +341,7 @@ class PHPReferenceResolver:
                 # Fallback: look for name/qualified_name after 'instanceof' keyword
                 instanceof_found = False
                 for child in node.children:
-                    if instanceof_found and child.type in ['name', 'qualified_name']:
+                    if instanceof_found and child.type in NAME_NODE_TYPES:
                         self._traverse_and_resolve_type_nodes(child, content, 
                                                              parent_symbol.id if parent_symbol else None, 
                                                              'INSTANCEOF')
@@ -332,7 +351,7 @@ class PHPReferenceResolver:
             elif parent_symbol:
                 self._traverse_and_resolve_type_nodes(rhs_node, content, parent_symbol.id, 'INSTANCEOF')
         
-        elif node.type in ['name', 'qualified_name']:
+        elif node.type in NAME_NODE_TYPES:
             # Could be a type reference in various contexts
             # Note: instanceof is handled directly now
             parent_type = node.parent.type if node.parent else None
@@ -518,7 +537,7 @@ class PHPReferenceResolver:
     def _resolve_new_expression(self, node: Node, content: bytes, parent_symbol: Optional[Symbol]) -> None:
         """Resolve a new expression like new ClassName()"""
         for child in node.children:
-            if child.type in ['name', 'qualified_name']:
+            if child.type in NAME_NODE_TYPES:
                 class_name = self._get_node_text(child, content)
                 
                 resolved = self._resolve_class_name(class_name)
@@ -553,7 +572,7 @@ class PHPReferenceResolver:
             if child.type == 'object_creation_expression':
                 # Find the class being instantiated
                 for grandchild in child.children:
-                    if grandchild.type in ['name', 'qualified_name']:
+                    if grandchild.type in NAME_NODE_TYPES:
                         exception_class = self._get_node_text(grandchild, content)
                         
                         resolved = self._resolve_class_name(exception_class)
@@ -576,7 +595,7 @@ class PHPReferenceResolver:
     def _resolve_type_reference(self, node: Node, content: bytes, 
                                source_id: str, reference_type: str) -> None:
         """Resolve a type reference with type validation"""
-        type_name = self._get_node_text(node, content)
+        type_name = self._name(node, content)
         
         resolved = self.resolver.resolve_type(type_name, self.context)
         
@@ -628,7 +647,7 @@ class PHPReferenceResolver:
     def _resolve_parameter_types(self, params_node: Node, content: bytes, function_id: str) -> None:
         """Resolve type hints in function parameters"""
         for child in params_node.children:
-            if child.type in ['simple_parameter', 'variadic_parameter', 'property_promotion_parameter']:
+            if child.type in PARAMETER_NODE_TYPES:
                 type_node = child.child_by_field_name('type')
                 if type_node:
                     # A parameter type can also be complex (union, etc.)
@@ -652,13 +671,11 @@ class PHPReferenceResolver:
             current_node = nodes_to_visit.pop()
             
             # If we find a name, resolve it. This is our base case.
-            if current_node.type in ['name', 'qualified_name']:
+            if current_node.type in NAME_NODE_TYPES:
                 type_name = self._get_node_text(current_node, content)
                 
                 # Ignore primitive types that won't be in the symbol table
-                if type_name not in ['string', 'int', 'float', 'bool', 'array', 
-                                     'object', 'void', 'mixed', 'never', 'null',
-                                     'false', 'true', 'callable', 'iterable', 'resource']:
+                if type_name not in _PRIMITIVE_TYPES:
                     self._resolve_type_reference(current_node, content, source_id, reference_type)
             # Otherwise, add its children to the stack to visit them next.
             else:
@@ -688,15 +705,7 @@ class PHPReferenceResolver:
     def _find_symbol_at_location(self, line: int, column: int, 
                                 symbol_type: SymbolType) -> Optional[Symbol]:
         """Find a symbol at a specific location in the current file"""
-        symbols = self.symbol_table.get_symbols_in_file(self.context.current_file)
-        
-        for symbol in symbols:
-            if (symbol.line_number == line and 
-                symbol.column_number == column and
-                symbol.type == symbol_type):
-                return symbol
-        
-        return None
+        return self._symbols_at.get((line, column, symbol_type))
     
     def _get_full_name(self, name: str) -> str:
         """Get the fully qualified name including namespace"""
@@ -706,8 +715,11 @@ class PHPReferenceResolver:
     
     def _get_file_main_symbol(self) -> Optional[Symbol]:
         """Get the main symbol for the current file (namespace or first class)"""
-        symbols = self.symbol_table.get_symbols_in_file(self.context.current_file)
-        
+        return self._file_main_symbol
+    
+    @staticmethod
+    def _select_main_symbol(symbols: List[Symbol]) -> Optional[Symbol]:
+        """Pick the symbol that file-level edges such as IMPORTS hang from"""
         # Prefer namespace
         for symbol in symbols:
             if symbol.type == SymbolType.NAMESPACE:
@@ -771,13 +783,13 @@ class PHPReferenceResolver:
         
         # Pattern 1: use TraitName;
         for child in node.children:
-            if child.type in ['name', 'qualified_name']:
+            if child.type in NAME_NODE_TYPES:
                 trait_names.append(self._get_node_text(child, content))
             
             # Pattern 2: use TraitName { method as alias; }
             elif child.type == 'use_list':
                 for list_child in child.children:
-                    if list_child.type in ['name', 'qualified_name']:
+                    if list_child.type in NAME_NODE_TYPES:
                         trait_names.append(self._get_node_text(list_child, content))
         
         # Resolve each trait and create USES_TRAIT relationship
@@ -799,6 +811,10 @@ class PHPReferenceResolver:
 
     def _create_external_symbol(self, name: str, is_likely_internal: bool = False) -> Optional[Symbol]:
         """Create external symbol with better classification"""
+        cached = self._external_symbols.get(name)
+        if cached is not None:
+            return cached
+        
         # Determine the type based on naming conventions
         symbol_type = SymbolType.CLASS  # Default to class
         
@@ -811,12 +827,12 @@ class PHPReferenceResolver:
             symbol_type = SymbolType.CLASS
         
         # Create a unique ID for the external symbol
-        import hashlib
-        symbol_id = f"external_{hashlib.md5(name.encode()).hexdigest()}"
+        symbol_id = f"external_{stable_hash(name)}"
         
         # Check if we already created this external symbol
         existing = self.symbol_table.get_by_id(symbol_id)
         if existing:
+            self._external_symbols[name] = existing
             return existing
         
         # Create the external symbol with better metadata
@@ -836,6 +852,7 @@ class PHPReferenceResolver:
         )
         
         self.symbol_table.add_symbol(symbol)
+        self._external_symbols[name] = symbol
         return symbol
     
     def _get_node_text(self, node: Node, content: bytes) -> str:
@@ -843,17 +860,27 @@ class PHPReferenceResolver:
         if not node:
             return ""
         return content[node.start_byte:node.end_byte].decode('utf-8')
+
+    def _name(self, node: Node, content: bytes) -> str:
+        """Text of a namespace, import or type name, interned.
+
+        These strings become context and resolve-cache keys that outlive the file.
+        """
+        return sys.intern(self._get_node_text(node, content))
     
     def resolve_directory(self, directory: str, extensions: List[str] = None) -> None:
         """Resolve references in all PHP files in a directory"""
         if extensions is None:
             extensions = ['.php']
         
-        path = Path(directory)
-        files = []
-        
-        for ext in extensions:
-            files.extend(path.rglob(f'*{ext}'))
+        # Single walk matching every extension at once
+        suffixes = tuple(extensions)
+        files = [
+            Path(root, name)
+            for root, _dirs, names in os.walk(directory)
+            for name in names
+            if name.endswith(suffixes)
+        ]
         
         total = len(files)
         for i, file_path in enumerate(files, 1):
@@ -2,19 +2,61 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Node, Parser, Query, QueryCursor
 import tree_sitter_python as tspython
 
+from src.core.hashing import stable_hasher
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _language() -> Language:
+    """The Python grammar, loaded once per process and shared by all parsers"""
+    return Language(tspython.language())
+
+
+# Builtin callees that never resolve to a project symbol, so no call reference is recorded.
+_SKIPPED_BUILTINS = frozenset({'print', 'len', 'str', 'int', 'list', 'dict', 'set', 'tuple', 'range'})
+
+# Caps in-progress matches per cursor so malformed input cannot blow up matching.
+_MATCH_LIMIT = 256
+
+# Shapes matched by tree-sitter in C rather than by the Python walk; one
+# multi-pattern query so the tree is scanned once. Handlers are looked up by
+# pattern index, so keep ``PythonParser._match_handlers`` in the same order.
+# Only calls through a plain name or attribute can name a symbol we resolve
+# later; constraining the callee lets the matcher reject the rest early.
+_QUERY = """
+(import_statement) @import
+(import_from_statement) @import_from
+(call function: [(identifier) (attribute)]) @call
+"""
+
+
+@lru_cache(maxsize=32)
+def _query(source: str) -> Query:
+    """Compile a query once per process; a Query is immutable and safe to share.
+
+    Bounded so that subclasses generating query text cannot grow it without limit.
+    """
+    return Query(_language(), source)
+
+
+def clear_query_cache() -> None:
+    """Drop compiled queries, e.g. after editing ``PythonParser.QUERY`` at runtime"""
+    _query.cache_clear()
+
+
+# One instance is created per match, so slots keep them dict-free.
+@dataclass(slots=True)
 class PySymbol:
     """Python symbol (class, function, method, etc.)"""
     id: str
@@ -26,7 +68,7 @@ class PySymbol:
     metadata: Dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PyReference:
     """Reference from one symbol to another"""
     source_id: str
@@ -41,19 +83,37 @@ class PyReference:
 class PythonParser:
     """Parse Python files and extract symbols and references"""
 
+    # Pattern order must match ``_match_handlers``.
+    QUERY = _QUERY
+
     def __init__(self) -> None:
-        self.language = Language(tspython.language())
+        self.language = _language()
         self.parser = Parser(self.language)
+        # Numeric field ids spare child_by_field_name's per-call name lookup.
+        field_id = self.language.field_id_for_name
+        self._name_field = field_id('name')
+        self._superclasses_field = field_id('superclasses')
+        self._parameters_field = field_id('parameters')
+        self._left_field = field_id('left')
+        self._module_name_field = field_id('module_name')
+        self._function_field = field_id('function')
+        self._query = _query(self.QUERY)
+        self._match_handlers = (self._handle_import, self._handle_import_from, self._handle_call)
         self.symbols: Dict[str, PySymbol] = {}
         self.references: List[PyReference] = []
         self.current_file = ""
         self.content = b""
+        self._symbol_hasher = stable_hasher()
+        self._call_hasher = stable_hasher()
         self.current_class = None
         self.imports: Dict[str, str] = {}  # alias -> full_name
 
     def parse_file(self, file_path: str) -> Tuple[List[PySymbol], List[PyReference]]:
         """Parse a Python file and return symbols and references"""
         self.current_file = file_path
+        # Every id in this file starts with the path; hash that part once.
+        self._symbol_hasher = stable_hasher(f"{file_path}:")
+        self._call_hasher = stable_hasher(f"{file_path}_")
         self.symbols.clear()
         self.references.clear()
         self.imports.clear()
@@ -64,6 +124,7 @@ class PythonParser:
 
         tree = self.parser.parse(self.content)
         self._traverse(tree.root_node)
+        self._extract_queries(tree.root_node)
 
         return list(self.symbols.values()), list(self.references)
 
@@ -88,15 +149,6 @@ class PythonParser:
         elif node.type == 'function_definition':
             self._register_function(node, parent_class)
 
-        elif node.type == 'import_statement':
-            self._handle_import(node)
-
-        elif node.type == 'import_from_statement':
-            self._handle_import_from(node)
-
-        elif node.type == 'call':
-            self._handle_call(node)
-
         elif node.type == 'assignment':
             self._handle_assignment(node, parent_class)
 
@@ -104,26 +156,39 @@ class PythonParser:
         for child in node.children:
             self._traverse(child, current_class)
 
+    def _extract_queries(self, root: Node) -> None:
+        """Collect imports and call sites; their handlers need no class context"""
+        handlers = self._match_handlers
+        cursor = QueryCursor(self._query, match_limit=_MATCH_LIMIT)
+        # In a file with syntax errors, query each top-level statement separately
+        # and leave ERROR subtrees out: matching inside them is pathologically slow.
+        targets = [child for child in root.children if not child.is_error] if root.has_error else (root,)
+        for target in targets:
+            for pattern_index, captures in cursor.matches(target):
+                # Every pattern has exactly one capture: the node its handler takes.
+                for nodes in captures.values():
+                    handlers[pattern_index](nodes[0])
+
     # ------------------------------------------------------------------
     # Symbol registration
     # ------------------------------------------------------------------
 
     def _register_class(self, node: Node) -> Optional[PySymbol]:
         """Register a class definition"""
-        name_node = node.child_by_field_name('name')
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
             return None
 
-        class_name = self._text(name_node)
+        class_name = self._name(name_node)
         symbol_id = self._symbol_id('class', node)
 
         # Extract base classes
         bases = []
-        superclasses_node = node.child_by_field_name('superclasses')
+        superclasses_node = node.child_by_field_id(self._superclasses_field)
         if superclasses_node:
             for child in superclasses_node.children:
                 if child.type == 'identifier':
-                    bases.append(self._text(child))
+                    bases.append(self._name(child))
 
         symbol = PySymbol(
             id=symbol_id,
@@ -153,11 +218,11 @@ class PythonParser:
 
     def _register_function(self, node: Node, parent_class: Optional[str] = None) -> Optional[PySymbol]:
         """Register a function or method definition"""
-        name_node = node.child_by_field_name('name')
+        name_node = node.child_by_field_id(self._name_field)
         if not name_node:
             return None
 
-        func_name = self._text(name_node)
+        func_name = self._name(name_node)
 
         # Determine if it's a method or function
         symbol_type = 'method' if parent_class else 'function'
@@ -172,13 +237,15 @@ class PythonParser:
 
         # Extract parameters
         params = []
-        parameters_node = node.child_by_field_name('parameters')
+        parameters_node = node.child_by_field_id(self._parameters_field)
         if parameters_node:
             for param in parameters_node.children:
                 if param.type == 'identifier':
-                    params.append(self._text(param))
+                    params.append(self._name(param))
 
-        is_async = any(child.type == 'async' for child in node.children)
+        # ``async`` can only be the leading token of the definition.
+        first_token = node.child(0)
+        is_async = first_token is not None and first_token.type == 'async'
 
         symbol = PySymbol(
             id=symbol_id,
@@ -199,11 +266,11 @@ class PythonParser:
 
     def _handle_assignment(self, node: Node, parent_class: Optional[str] = None) -> None:
         """Handle variable assignments"""
-        left_node = node.child_by_field_name('left')
+        left_node = node.child_by_field_id(self._left_field)
         if not left_node or left_node.type != 'identifier':
             return
 
-        var_name = self._text(left_node)
+        var_name = self._name(left_node)
 
         # Skip private variables
         if var_name.startswith('_') and not parent_class:
@@ -231,7 +298,7 @@ class PythonParser:
         """Handle import statements: import module"""
         for child in node.children:
             if child.type == 'dotted_name':
-                module_name = self._text(child)
+                module_name = self._name(child)
                 self.imports[module_name] = module_name
 
                 symbol_id = self._symbol_id('import', node)
@@ -248,20 +315,20 @@ class PythonParser:
 
     def _handle_import_from(self, node: Node) -> None:
         """Handle from...import statements"""
-        module_node = node.child_by_field_name('module_name')
+        module_node = node.child_by_field_id(self._module_name_field)
         if not module_node:
             return
 
-        module_name = self._text(module_node)
+        module_name = self._name(module_node)
 
         # Get imported names
         for child in node.children:
             if child.type == 'dotted_name' and child != module_node:
-                imported_name = self._text(child)
+                imported_name = self._name(child)
                 self.imports[imported_name] = f"{module_name}.{imported_name}"
 
             elif child.type == 'identifier':
-                imported_name = self._text(child)
+                imported_name = self._name(child)
                 self.imports[imported_name] = f"{module_name}.{imported_name}"
 
         symbol_id = self._symbol_id('import', node)
@@ -278,18 +345,20 @@ class PythonParser:
 
     def _handle_call(self, node: Node) -> None:
         """Handle function calls to create CALLS relationships"""
-        function_node = node.child_by_field_name('function')
+        function_node = node.child_by_field_id(self._function_field)
         if not function_node:
             return
 
         func_name = self._text(function_node)
 
         # Skip built-in functions
-        if func_name in {'print', 'len', 'str', 'int', 'list', 'dict', 'set', 'tuple', 'range'}:
+        if func_name in _SKIPPED_BUILTINS:
             return
 
         # Create a call reference (we'll resolve the target later)
-        call_id = f"call_{hashlib.md5(f'{self.current_file}_{node.start_point}'.encode()).hexdigest()[:16]}"
+        hasher = self._call_hasher.copy()
+        hasher.update(f"{node.start_point}".encode())
+        call_id = f"call_{hasher.hexdigest()[:16]}"
 
         # Try to find the current function/method we're in
         # This is a simplified version - a full implementation would track scope
@@ -315,8 +384,13 @@ class PythonParser:
         """Extract text from a node"""
         return self.content[node.start_byte:node.end_byte].decode('utf-8')
 
+    def _name(self, node: Node) -> str:
+        """Extract an identifier, sharing one copy of each repeated name"""
+        return sys.intern(self._text(node))
+
     def _symbol_id(self, prefix: str, node: Node) -> str:
         """Generate a unique symbol ID"""
-        position = f"{self.current_file}:{node.start_point[0]}:{node.start_point[1]}"
-        hash_part = hashlib.md5(position.encode()).hexdigest()[:16]
+        hasher = self._symbol_hasher.copy()
+        hasher.update(f"{node.start_point[0]}:{node.start_point[1]}".encode())
+        hash_part = hasher.hexdigest()[:16]
         return f"python_{prefix}_{hash_part}"
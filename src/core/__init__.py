@@ -2,5 +2,9 @@
 
 from .symbol_table import SymbolTable, Symbol, SymbolType
 from .resolution import SymbolResolver
+from .hashing import stable_hash, stable_hasher, file_symbol_id, directory_symbol_id
 
-__all__ = ['SymbolTable', 'Symbol', 'SymbolType', 'SymbolResolver']
\ No newline at end of file
+__all__ = [
+    'SymbolTable', 'Symbol', 'SymbolType', 'SymbolResolver',
+    'stable_hash', 'stable_hasher', 'file_symbol_id', 'directory_symbol_id',
+]
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""Hashing helpers for stable symbol and file identifiers."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Union
+
+
+def stable_hash(data: Union[str, bytes]) -> str:
+    """Return a 32-character hex digest of ``data``.
+
+    BLAKE2b with a 16-byte digest is faster than MD5 on 64-bit CPUs, ships with
+    the standard library and keeps identifiers the same width as before.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def stable_hasher(prefix: Union[str, bytes] = b"") -> Any:
+    """Return a BLAKE2b hasher already fed with ``prefix``.
+
+    When many identifiers share a prefix, ``copy()`` the hasher and feed only
+    the differing suffix. ``hexdigest()`` matches ``stable_hash(prefix + suffix)``.
+    """
+    if isinstance(prefix, str):
+        prefix = prefix.encode()
+    return hashlib.blake2b(prefix, digest_size=16)
+
+
+def file_symbol_id(path: Union[str, Path]) -> str:
+    """Identifier of the FILE symbol for ``path``."""
+    return f"file_{stable_hash(str(path))}"
+
+
+def directory_symbol_id(path: Union[str, Path]) -> str:
+    """Identifier of the DIRECTORY symbol for ``path``."""
+    return f"dir_{stable_hash(str(path))}"
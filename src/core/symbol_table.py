@@ -3,11 +3,11 @@
 import sqlite3
 import json
 from enum import Enum
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Set
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from pathlib import Path
 from functools import lru_cache
-import hashlib
+from .hashing import stable_hash
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,7 +38,8 @@ class SymbolType(Enum):
     JSX_ELEMENT = "JSXElement"
 
 
-@dataclass
+# Symbols are created in bulk by every parser; slots keep them dict-free
+@dataclass(slots=True)
 class Symbol:
     """Represents a symbol in the codebase"""
     id: str
@@ -63,11 +64,14 @@ class Symbol:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
+        # Shallow field read: asdict() would deep-copy lists and dicts that
+        # are only serialized to JSON here
         result = {}
-        for key, value in asdict(self).items():
+        for key in _SYMBOL_COLUMNS:
+            value = getattr(self, key)
             if key == 'type':
                 result[key] = value.value
-            elif key in ['parameters', 'implements', 'uses', 'metadata'] and value:
+            elif key in _JSON_COLUMNS and value:
                 result[key] = json.dumps(value)
             else:
                 result[key] = value
@@ -80,8 +84,8 @@ class Symbol:
         data['type'] = SymbolType(data['type'])
         
         # Parse JSON fields
-        for field in ['parameters', 'implements', 'uses', 'metadata']:
-            if field in data and data[field]:
+        for field in _JSON_COLUMNS:
+            if data.get(field):
                 data[field] = json.loads(data[field])
         
         # Remove database-only fields
@@ -91,6 +95,16 @@ class Symbol:
         return cls(**data)
 
 
+# Fixed column order shared by every symbol row written to SQLite
+_SYMBOL_COLUMNS = tuple(f.name for f in fields(Symbol))
+# Structured fields, stored as JSON text
+_JSON_COLUMNS = frozenset({'parameters', 'implements', 'uses', 'metadata'})
+_INSERT_SYMBOL_SQL = f"""
+    INSERT OR REPLACE INTO symbols ({', '.join(_SYMBOL_COLUMNS)})
+    VALUES ({', '.join('?' for _ in _SYMBOL_COLUMNS)})
+"""
+
+
 class SymbolTable:
     """Symbol Table with SQLite backend for fast lookups"""
     
@@ -188,29 +202,29 @@ class SymbolTable:
     
     def add_symbol(self, symbol: Symbol) -> None:
         """Add a symbol to the table"""
+        self.conn.execute(_INSERT_SYMBOL_SQL, self._symbol_row(symbol))
+    
+    def add_symbols(self, symbols: Iterable[Symbol]) -> None:
+        """Add many symbols in one statement"""
+        self.conn.executemany(_INSERT_SYMBOL_SQL, (self._symbol_row(symbol) for symbol in symbols))
+    
+    def _symbol_row(self, symbol: Symbol) -> Tuple[Any, ...]:
+        """Flatten a symbol into a row tuple in ``_SYMBOL_COLUMNS`` order"""
         data = symbol.to_dict()
         
         # Generate ID if not provided
         if not symbol.id:
             id_string = f"{symbol.file_path}:{symbol.name}:{symbol.line_number}:{symbol.column_number}"
-            symbol.id = hashlib.md5(id_string.encode()).hexdigest()
+            symbol.id = stable_hash(id_string)
             data['id'] = symbol.id
         
         # Generate hash for content
         if not data.get('hash'):
             type_str = data['type'] if isinstance(data['type'], str) else data['type'].value
             hash_string = f"{data['name']}:{type_str}:{data.get('namespace') or ''}"
-            data['hash'] = hashlib.md5(hash_string.encode()).hexdigest()
+            data['hash'] = stable_hash(hash_string)
         
-        columns = list(data.keys())
-        placeholders = ['?' for _ in columns]
-        
-        query = f"""
-            INSERT OR REPLACE INTO symbols ({', '.join(columns)})
-            VALUES ({', '.join(placeholders)})
-        """
-        
-        self.conn.execute(query, [data[col] for col in columns])
+        return tuple(data[column] for column in _SYMBOL_COLUMNS)
         
     def add_reference(self, source_id: str, target_id: str, 
                      reference_type: str, line: int, column: int,
@@ -222,6 +236,18 @@ class SymbolTable:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (source_id, target_id, reference_type, line, column, context))
     
+    def add_references(self, references: Iterable[Tuple[str, str, str, int, int, Optional[str]]]) -> None:
+        """Add many references in one statement.
+        
+        Each item is ``(source_id, target_id, reference_type, line, column, context)``;
+        the iterable is consumed lazily, so callers can pass a generator.
+        """
+        self.conn.executemany("""
+            INSERT OR IGNORE INTO symbol_references 
+            (source_id, target_id, reference_type, line_number, column_number, context)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, references)
+    
     def resolve(self, name: str, current_namespace: str = "",
                 imports: Optional[Dict[str, str]] = None) -> Optional[Symbol]:
         """FIXED VERSION - Resolve a symbol name to a Symbol object
@@ -402,16 +428,25 @@ class SymbolTable:
         row = cursor.fetchone()
         return row['hash'] if row else None
     
+    def get_file_hashes(self) -> Dict[str, str]:
+        """Get the stored hash of every parsed file in one query"""
+        cursor = self.conn.execute("SELECT file_path, hash FROM file_hashes")
+        return {row['file_path']: row['hash'] for row in cursor}
+    
     def needs_parsing(self, file_path: str, current_hash: str) -> bool:
         """Check if a file needs parsing based on hash"""
         stored_hash = self.get_file_hash(file_path)
         return stored_hash != current_hash
     
     def clear_file_symbols(self, file_path: str) -> None:
-        """Clear all symbols from a file (before re-parsing)"""
+        """Clear all symbols from a file (before re-parsing)
+        
+        The file's own FILE node is kept: it is written by the file structure
+        pass, which runs before the language collectors and is not repeated.
+        """
         self.conn.execute(
-            "DELETE FROM symbols WHERE file_path = ?",
-            (file_path,)
+            "DELETE FROM symbols WHERE file_path = ? AND type != ?",
+            (file_path, SymbolType.FILE.value)
         )
     
     def commit(self) -> None:
@@ -8,7 +8,7 @@ from collections import defaultdict
 
 def generate_id(text):
     """Generate consistent ID for any text"""
-    return hashlib.md5(text.encode()).hexdigest()
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
 def export_to_neo4j_with_files():
     """Export complete graph including file system structure"""
@@ -67,16 +67,18 @@ def export_to_neo4j_with_files():
                 # Clean file path
                 file_path = file_path.replace('espocrm/', '')
                 
-                # Generate file ID
-                file_id = generate_id(file_path)
-                files[file_path] = file_id
                 file_symbols[file_path].append(symbol_id)
                 
-                # Extract directory structure
-                parts = file_path.split('/')
-                for i in range(1, len(parts)):
-                    dir_path = '/'.join(parts[:i])
-                    directories.add(dir_path)
+                # A file holds many symbols; hash its path and walk its
+                # directories only the first time it is seen
+                if file_path not in files:
+                    files[file_path] = generate_id(file_path)
+                    
+                    # Extract directory structure
+                    parts = file_path.split('/')
+                    for i in range(1, len(parts)):
+                        dir_path = '/'.join(parts[:i])
+                        directories.add(dir_path)
         
         print(f"Found {len(directories)} directories")
         print(f"Found {len(files)} files")
@@ -1,6 +1,7 @@
 """Neo4j Batch Writer - Efficiently writes Symbol Table data to Neo4j"""
 
 import json
+from collections import defaultdict
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import logging
@@ -204,12 +205,9 @@ class Neo4jBatchWriter:
         logger.info(f"Writing {len(edges)} relationships in batches of {self.config.batch_size}")
         
         # Group edges by type for more efficient queries
-        edges_by_type = {}
+        edges_by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for edge in edges:
-            edge_type = edge['type']
-            if edge_type not in edges_by_type:
-                edges_by_type[edge_type] = []
-            edges_by_type[edge_type].append(edge)
+            edges_by_type[edge['type']].append(edge)
         
         with self.driver.session(database=self.config.database) as session:
             for edge_type, typed_edges in edges_by_type.items():
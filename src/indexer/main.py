@@ -10,10 +10,9 @@ import sys
 import time
 import json
 import sqlite3
-import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 try:
     from tqdm import tqdm
@@ -26,9 +25,11 @@ except ImportError:
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Backend parsers
+from src.core.hashing import directory_symbol_id, file_symbol_id
 from src.core.symbol_table import SymbolTable, Symbol, SymbolType
 from src.pipeline import PipelineConfig, load_pipeline_config, CodebaseIndexer
-from src.pipeline.indexer import JavaScriptLanguageModule
+from src.pipeline.endpoints import ACTION_METHOD_RE, API_ENDPOINT_RE, CONTROLLER_NAME_RE
+from src.pipeline.indexer import JavaScriptLanguageModule, discover_files
 from src.plugins import create_registry
 from src.plugins.espocrm import EspoApiScanner
 from src.tools import ensure_database_ready, wipe_database, GraphExporter, GraphImporter
@@ -47,6 +48,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
 class CompleteEspoCRMIndexer:
     """Complete indexer for entire EspoCRM codebase"""
     
@@ -80,7 +82,7 @@ class CompleteEspoCRMIndexer:
             'php_references': 0,
             'js_references': 0,
             'cross_language_links': 0,
-            'api_endpoints': {},
+            'api_endpoints': Counter(),
             'total_time': 0
         }
         
@@ -172,7 +174,7 @@ class CompleteEspoCRMIndexer:
             dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'vendor' and d != 'node_modules']
             
             # Create directory node
-            dir_id = f"dir_{hashlib.md5(str(root_path).encode()).hexdigest()}"
+            dir_id = directory_symbol_id(root_path)
 
             if str(root_path) not in seen_dirs:
                 dir_sym = Symbol(
@@ -191,7 +193,7 @@ class CompleteEspoCRMIndexer:
                 # Create parent-child relationship for directories
                 parent_path = root_path.parent
                 if str(parent_path) in seen_dirs and str(parent_path) != str(root_path):
-                    parent_id = f"dir_{hashlib.md5(str(parent_path).encode()).hexdigest()}"
+                    parent_id = directory_symbol_id(parent_path)
                     self.symbol_table.add_reference(
                         source_id=parent_id,
                         target_id=dir_id,
@@ -209,7 +211,7 @@ class CompleteEspoCRMIndexer:
                 if not any(file_name.endswith(ext) for ext in ['.php', '.js', '.jsx', '.ts', '.tsx', '.json', '.yml', '.yaml', '.xml', '.html', '.css', '.scss']):
                     continue
                 
-                file_id = f"file_{hashlib.md5(str(file_path).encode()).hexdigest()}"
+                file_id = file_symbol_id(file_path)
                 
                 file_sym = Symbol(
                     id=file_id,
@@ -282,23 +284,14 @@ class CompleteEspoCRMIndexer:
     
     def _index_javascript_frontend(self):
         """Index all JavaScript files"""
-        js_patterns = ["*.js", "*.jsx", "*.mjs"]
         js_files = []
         
-        # Find JavaScript files in client/src
-        client_src_path = self.project_path / "client" / "src"
-        if client_src_path.exists():
-            for pattern in js_patterns:
-                js_files.extend(client_src_path.rglob(pattern))
-        
-        # Also check client/modules
-        client_modules_path = self.project_path / "client" / "modules"
-        if client_modules_path.exists():
-            for pattern in js_patterns:
-                js_files.extend(client_modules_path.rglob(pattern))
-        
-        # Filter out node_modules and lib
-        js_files = [f for f in js_files if 'node_modules' not in str(f) and '/lib/' not in str(f)]
+        # Find JavaScript files in client/src and client/modules, skipping node_modules and lib
+        for client_path in (self.project_path / "client" / "src", self.project_path / "client" / "modules"):
+            if client_path.exists():
+                js_files.extend(
+                    discover_files(client_path, (".js", ".jsx", ".mjs"), frozenset({"node_modules", "lib"}))
+                )
         self.stats['js_files'] = len(js_files)
         
         logger.info(f"Found {len(js_files)} JavaScript files")
@@ -395,18 +388,25 @@ class CompleteEspoCRMIndexer:
                 AND name LIKE 'action%'
             """, (controller['id'],)).fetchall()
             
+            controller_match = CONTROLLER_NAME_RE.search(controller_name)
+            if not controller_match:
+                continue
+            controller_base = controller_match.group(1).lower()
+            
             for method in methods:
                 # Create endpoint mapping
-                # e.g., LeadController::actionConvert -> Lead/action/convert
-                controller_base = controller_name.replace('Controller', '')
-                action_name = method['name'].replace('action', '').lower()
+                # e.g., LeadController::actionConvert -> lead/convert
+                action_match = ACTION_METHOD_RE.match(method['name'])
+                if not action_match:
+                    continue
+                action_name = action_match.group(1).lower()
                 
                 if action_name == 'index':
-                    endpoint_key = f"{controller_base}"
+                    endpoint_key = controller_base
                 else:
-                    endpoint_key = f"{controller_base}/action/{action_name}"
+                    endpoint_key = f"{controller_base}/{action_name}"
                 
-                self.php_endpoints[endpoint_key.lower()] = {
+                self.php_endpoints[endpoint_key] = {
                     'controller_id': controller['id'],
                     'method_id': method['id'],
                     'controller': controller_name,
@@ -423,29 +423,31 @@ class CompleteEspoCRMIndexer:
 
         for module in self.codebase_indexer.modules:
             if isinstance(module, JavaScriptLanguageModule):
-                self.js_api_calls = [dict(call) for call in module.api_calls]
+                self.js_api_calls = list(module.api_calls)
                 break
     
     def _create_cross_language_links(self):
         """Create links between JavaScript API calls and PHP endpoints"""
         links_created = 0
+        # The same endpoint is called from many places; match each distinct one once
+        matched_endpoints: Dict[str, Optional[Dict]] = {}
         
         for api_call in self.js_api_calls:
             endpoint = api_call['endpoint']
             if not endpoint:
                 continue
             
-            # Normalize endpoint
-            endpoint_key = endpoint.strip('/').lower()
-            
-            # Try to find matching PHP endpoint
-            php_endpoint = self.php_endpoints.get(endpoint_key)
-            
-            if not php_endpoint:
-                # Try without 'action/' prefix
-                if '/action/' in endpoint_key:
-                    alt_key = endpoint_key.replace('/action/', '/')
-                    php_endpoint = self.php_endpoints.get(alt_key)
+            if endpoint in matched_endpoints:
+                php_endpoint = matched_endpoints[endpoint]
+            else:
+                # Normalize endpoint: Entity[/action]/name -> entity/name
+                php_endpoint = None
+                endpoint_match = API_ENDPOINT_RE.match(endpoint)
+                if endpoint_match:
+                    entity, action = endpoint_match.groups()
+                    endpoint_key = f"{entity}/{action}".lower() if action else entity.lower()
+                    php_endpoint = self.php_endpoints.get(endpoint_key)
+                matched_endpoints[endpoint] = php_endpoint
             
             if php_endpoint:
                 # Create cross-language reference
@@ -461,7 +463,7 @@ class CompleteEspoCRMIndexer:
                 
                 # Track in statistics
                 endpoint_stat = f"{api_call['method']} {endpoint}"
-                self.stats['api_endpoints'][endpoint_stat] = self.stats['api_endpoints'].get(endpoint_stat, 0) + 1
+                self.stats['api_endpoints'][endpoint_stat] += 1
         
         self.stats['cross_language_links'] = links_created
         logger.info(f"Created {links_created} cross-language links")
@@ -519,7 +521,7 @@ class CompleteEspoCRMIndexer:
         for symbol_id, file_path in symbols:
             if file_path:
                 # Generate file ID
-                file_id = f"file_{hashlib.md5(file_path.encode()).hexdigest()}"
+                file_id = file_symbol_id(file_path)
                 
                 # Check if file node exists
                 file_exists = cursor.execute(
@@ -684,9 +686,7 @@ class CompleteEspoCRMIndexer:
         
         if self.stats['api_endpoints']:
             print(f"\n📡 TOP API ENDPOINTS:")
-            sorted_endpoints = sorted(self.stats['api_endpoints'].items(), 
-                                     key=lambda x: x[1], reverse=True)[:10]
-            for endpoint, count in sorted_endpoints:
+            for endpoint, count in self.stats['api_endpoints'].most_common(10):
                 print(f"  {endpoint}: {count} calls")
         
         # Calculate edge type statistics
@@ -698,10 +698,11 @@ class CompleteEspoCRMIndexer:
             FROM symbol_references 
             GROUP BY reference_type 
             ORDER BY count DESC
+            LIMIT 15
         """).fetchall()
         
         print(f"\n📈 EDGE TYPES:")
-        for edge_type in edge_types[:15]:  # Show top 15
+        for edge_type in edge_types:  # Top 15
             print(f"  {edge_type[0]}: {edge_type[1]}")
         
         conn.close()
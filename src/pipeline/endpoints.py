@@ -0,0 +1,16 @@
+"""Patterns that pair JavaScript API calls with PHP controller actions."""
+
+from __future__ import annotations
+
+import re
+
+# LeadController (optionally namespaced) -> Lead
+CONTROLLER_NAME_RE = re.compile(r'(?:^|\\)([^\\]+?)Controller$')
+# actionConvert -> Convert
+ACTION_METHOD_RE = re.compile(r'^action(\w+)$')
+# /api/v1/Lead/action/convert?x=1 -> ('lead', 'convert'); Lead/convert -> ('lead', 'convert')
+# Anchored at both ends: 'action' must be a whole segment, and deeper paths such
+# as Lead/123/stream do not match at all.
+API_ENDPOINT_RE = re.compile(
+    r'^/*(?:api/v1/)?([^/?#]+)(?:/action(?=/))?(?:/([^/?#]+))?/?(?:[?#].*)?$', re.IGNORECASE
+)
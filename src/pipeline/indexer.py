@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Protocol, TYPE_CHECKING
 
+from src.core.hashing import directory_symbol_id, file_symbol_id, stable_hash
 from src.core.symbol_table import Symbol, SymbolTable, SymbolType
 from src.pipeline.config import PipelineConfig
 
@@ -16,6 +16,10 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 
 logger = logging.getLogger(__name__)
 
+_INDEXABLE_SUFFIXES = (
+    '.php', '.js', '.jsx', '.ts', '.tsx', '.json', '.yml', '.yaml', '.xml', '.html', '.css', '.scss',
+)
+
 
 class LanguageModule(Protocol):
     """Interface for language-specific indexing steps."""
@@ -122,25 +126,26 @@ class CodebaseIndexer:
 
         for root, dirs, files in self._walk_project_root():
             root_path = Path(root)
-            dir_id = f"dir_{hashlib.md5(str(root_path).encode()).hexdigest()}"
+            root_str = str(root_path)
+            dir_id = directory_symbol_id(root_str)
 
-            if str(root_path) not in seen_dirs:
+            if root_str not in seen_dirs:
                 dir_sym = Symbol(
                     id=dir_id,
                     name=root_path.name or str(self.project_root),
                     type=SymbolType.DIRECTORY,
-                    file_path=str(root_path),
+                    file_path=root_str,
                     line_number=0,
                     column_number=0,
-                    metadata={"node_type": "directory", "path": str(root_path)},
+                    metadata={"node_type": "directory", "path": root_str},
                 )
                 self.symbol_table.add_symbol(dir_sym)
-                seen_dirs.add(str(root_path))
+                seen_dirs.add(root_str)
                 dir_count += 1
 
                 parent_path = root_path.parent
-                if str(parent_path) in seen_dirs and str(parent_path) != str(root_path):
-                    parent_id = f"dir_{hashlib.md5(str(parent_path).encode()).hexdigest()}"
+                if str(parent_path) in seen_dirs and str(parent_path) != root_str:
+                    parent_id = directory_symbol_id(parent_path)
                     self.symbol_table.add_reference(
                         source_id=parent_id,
                         target_id=dir_id,
@@ -154,13 +159,14 @@ class CodebaseIndexer:
                 if not self._is_indexable_file(file_name):
                     continue
                 file_path = root_path / file_name
-                file_id = f"file_{hashlib.md5(str(file_path).encode()).hexdigest()}"
+                file_str = str(file_path)
+                file_id = file_symbol_id(file_str)
 
                 file_sym = Symbol(
                     id=file_id,
                     name=file_name,
                     type=SymbolType.FILE,
-                    file_path=str(file_path),
+                    file_path=file_str,
                     line_number=0,
                     column_number=0,
                     metadata={"node_type": "file", "extension": file_path.suffix},
@@ -187,10 +193,7 @@ class CodebaseIndexer:
             yield root, dirs, files
 
     def _is_indexable_file(self, filename: str) -> bool:
-        return any(
-            filename.endswith(ext)
-            for ext in ['.php', '.js', '.jsx', '.ts', '.tsx', '.json', '.yml', '.yaml', '.xml', '.html', '.css', '.scss']
-        )
+        return filename.endswith(_INDEXABLE_SUFFIXES)
 
 
 # ----------------------------------------------------------------------
@@ -198,7 +201,8 @@ class CodebaseIndexer:
 # ----------------------------------------------------------------------
 
 import os
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet, Iterator, Tuple, Type, Union
 
 from parsers.php_enhanced import PHPSymbolCollector
 from parsers.php_reference_resolver import PHPReferenceResolver
@@ -210,29 +214,196 @@ def os_walk(root: Path):  # pragma: no cover - passthrough helper for testabilit
     return os.walk(root)
 
 
+def discover_files(
+    root: Path,
+    suffixes: Tuple[str, ...],
+    excluded_dirs: AbstractSet[str] = frozenset(),
+) -> List[Path]:
+    """Walk ``root`` once and return files ending in any of ``suffixes``.
+
+    Directories named in ``excluded_dirs`` are pruned during the walk rather
+    than filtered out afterwards.
+    """
+    found: List[Path] = []
+    for current, dirs, files in os_walk(root):
+        if excluded_dirs:
+            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        found.extend(Path(current, name) for name in files if name.endswith(suffixes))
+    return found
+
+
+def _file_signature(path: Path) -> Optional[str]:
+    """Cheap change marker from stat(); stored alongside content hashes in ``file_hashes``."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"stat:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _changed_files(
+    symbol_table: SymbolTable, files: List[Path], signatures: Dict[Path, Optional[str]]
+) -> List[Path]:
+    """Files whose signature differs from the one recorded at their last parse."""
+    # One query for the whole table beats a lookup per file on large trees.
+    stored = symbol_table.get_file_hashes()
+    return [
+        path
+        for path in files
+        if signatures[path] is None or stored.get(str(path)) != signatures[path]
+    ]
+
+
+# Parse results travel as plain tuples: they pickle several times faster than
+# dataclass instances when crossing the process pool boundary.
+_SymbolRow = Tuple[str, str, str, int, int, Dict[str, object]]  # id, name, type, line, column, metadata
+_ReferenceRow = Tuple[str, str, str, int, int, str]  # source, target, type, line, column, context
+
+
+class _FileParser(Protocol):
+    """What the JavaScript and Python parsers share: one file in, symbols and references out."""
+
+    def parse_file(self, file_path: str) -> Tuple[list, list]:
+        ...
+
+
+def _rows(
+    symbols: List[Union[JSSymbol, PySymbol]], references: List[Union[JSReference, PyReference]]
+) -> Tuple[List[_SymbolRow], List[_ReferenceRow]]:
+    return (
+        [(s.id, s.name, s.type, s.line, s.column, s.metadata) for s in symbols],
+        [(r.source_id, r.target_id, r.type, r.line, r.column, r.context) for r in references],
+    )
+
+
+_worker_parser: Optional[_FileParser] = None
+
+
+def _init_parser_worker(parser_class: Type[_FileParser]) -> None:
+    """Build one parser per worker process so grammar setup is paid once, not per file."""
+    global _worker_parser
+    _worker_parser = parser_class()
+
+
+def _parse_file_rows(path: str) -> Tuple[str, List[_SymbolRow], List[_ReferenceRow], Optional[str]]:
+    """Parse a single file with the worker's parser; module-level so worker processes can pickle it."""
+    try:
+        symbols, references = _worker_parser.parse_file(path)
+    except Exception as exc:  # pragma: no cover - reported by the driver
+        return path, [], [], str(exc)
+    return (path, *_rows(symbols, references), None)
+
+
+def _iter_parsed_rows(
+    parser: _FileParser,
+    files: List[Path],
+    max_workers: Optional[int],
+    min_parallel_files: int,
+    label: str,
+) -> Iterator[Tuple[Path, List[_SymbolRow], List[_ReferenceRow]]]:
+    """Yield parse results per file, fanning out to a process pool for large batches.
+
+    Workers build their own instance of ``type(parser)``; failures are logged
+    under ``label`` and the file is skipped.
+    """
+    if max_workers == 1 or len(files) < min_parallel_files:
+        for file_path in files:
+            try:
+                symbols, references = parser.parse_file(str(file_path))
+            except Exception as exc:  # pragma: no cover - passthrough logging
+                logger.debug("%s parse failed for %s: %s", label, file_path, exc)
+                continue
+            yield (file_path, *_rows(symbols, references))
+        return
+
+    paths = [str(path) for path in files]
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_parser_worker, initargs=(type(parser),)
+    ) as executor:
+        for path, symbols, references, error in executor.map(_parse_file_rows, paths, chunksize=16):
+            if error is not None:
+                logger.debug("%s parse failed for %s: %s", label, path, error)
+                continue
+            yield Path(path), symbols, references
+
+
+_worker_php_collector: Optional[PHPSymbolCollector] = None
+
+
+def _init_php_worker() -> None:
+    """Build one collector per worker process so grammar setup is paid once, not per file."""
+    global _worker_php_collector
+    _worker_php_collector = PHPSymbolCollector(None)
+
+
+def _collect_php_file(
+    item: Tuple[str, Optional[str]]
+) -> Tuple[str, Optional[str], Optional[List[Symbol]], Optional[str]]:
+    """Read, hash and collect one PHP file; module-level so worker processes can pickle it.
+
+    ``item`` is the path and the hash stored at its last parse. Returns the path,
+    its current hash, its symbols (``None`` when the hash is unchanged) and an
+    error message.
+    """
+    path, stored_hash = item
+    collector = _worker_php_collector or PHPSymbolCollector(None)
+    try:
+        with open(path, "rb") as handle:
+            content = handle.read()
+        file_hash = stable_hash(content)
+        if file_hash == stored_hash:
+            return path, file_hash, None, None
+        return path, file_hash, collector.collect_symbols(path, content), None
+    except Exception as exc:  # pragma: no cover - reported by the driver
+        return path, None, None, str(exc)
+
+
 @dataclass
 class PHPLanguageModule:
     project_root: Path
     symbol_table: SymbolTable
     name: str = "php"
     _stats: Dict[str, int] = field(default_factory=dict)
+    php_files: List[Path] = field(default_factory=list, init=False, repr=False)
+    max_workers: Optional[int] = None
+    min_parallel_files: int = 32
 
     def collect(self) -> None:
-        collector = PHPSymbolCollector(self.symbol_table)
-        php_files = list(self.project_root.rglob("*.php"))
+        self.php_files = php_files = discover_files(self.project_root, (".php",))
         self._stats["php_files"] = len(php_files)
 
-        for idx, file_path in enumerate(php_files, 1):
-            try:
-                collector.parse_file(str(file_path))
-            except Exception as exc:  # pragma: no cover - passthrough logging
-                logger.debug("PHP symbol collection failed for %s: %s", file_path, exc)
-            if idx % 200 == 0:
-                logger.debug("Collected PHP symbols from %s/%s files", idx, len(php_files))
+        if self.max_workers == 1 or len(php_files) < self.min_parallel_files:
+            collector = PHPSymbolCollector(self.symbol_table)
+            for idx, file_path in enumerate(php_files, 1):
+                try:
+                    collector.parse_file(str(file_path))
+                except Exception as exc:  # pragma: no cover - passthrough logging
+                    logger.debug("PHP symbol collection failed for %s: %s", file_path, exc)
+                if idx % 200 == 0:
+                    logger.debug("Collected PHP symbols from %s/%s files", idx, len(php_files))
+            return
+
+        # Workers read, hash and parse, so file contents never pile up in this
+        # process; every write stays here.
+        stored = self.symbol_table.get_file_hashes()
+        items = [(str(file_path), stored.get(str(file_path))) for file_path in php_files]
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_php_worker) as executor:
+            results = executor.map(_collect_php_file, items, chunksize=16)
+            for idx, (path, file_hash, symbols, error) in enumerate(results, 1):
+                if error is not None:
+                    logger.debug("PHP symbol collection failed for %s: %s", path, error)
+                elif symbols is not None:
+                    self.symbol_table.clear_file_symbols(path)
+                    self.symbol_table.add_symbols(symbols)
+                    self.symbol_table.update_file_hash(path, file_hash)
+                if idx % 200 == 0:
+                    logger.debug("Collected PHP symbols from %s/%s files", idx, len(items))
+        self.symbol_table.commit()
 
     def resolve(self) -> None:
         resolver = PHPReferenceResolver(self.symbol_table)
-        php_files = list(self.project_root.rglob("*.php"))
+        php_files = self.php_files or discover_files(self.project_root, (".php",))
         for idx, file_path in enumerate(php_files, 1):
             try:
                 resolver.resolve_file(str(file_path))
@@ -258,6 +429,9 @@ class JavaScriptLanguageModule:
     parser: JavaScriptParser = field(default_factory=JavaScriptParser)
     api_calls: List[Dict[str, object]] = field(default_factory=list)
     processed_files: List[Path] = field(default_factory=list)
+    max_workers: Optional[int] = None
+    min_parallel_files: int = 32
+    skip_unchanged: bool = True
 
     def collect(self) -> None:
         js_files = self._discover_files()
@@ -268,58 +442,33 @@ class JavaScriptLanguageModule:
         self.api_calls.clear()
         self.processed_files = list(js_files)
 
-        for idx, file_path in enumerate(js_files, 1):
-            try:
-                symbols, references = self.parser.parse_file(str(file_path))
-            except Exception as exc:  # pragma: no cover - passthrough logging
-                logger.debug("JS parse failed for %s: %s", file_path, exc)
-                continue
-
-            for symbol in symbols:
-                symbol_id = f"js_{symbol.id}"
-                sym = Symbol(
-                    id=symbol_id,
-                    name=symbol.name,
-                    type=self._map_symbol_type(symbol.type),
-                    file_path=str(file_path),
-                    line_number=symbol.line,
-                    column_number=symbol.column,
-                    namespace=None,
-                    parent_id=None,
-                    metadata={"js_type": symbol.type, "js_metadata": symbol.metadata},
-                )
-                self.symbol_table.add_symbol(sym)
-
-                if symbol.type == 'api_call':
-                    self.api_calls.append(
-                        {
-                            'symbol_id': symbol_id,
-                            'endpoint': symbol.metadata.get('endpoint'),
-                            'method': symbol.metadata.get('method'),
-                            'php_controller': symbol.metadata.get('php_controller'),
-                            'php_method': symbol.metadata.get('php_method'),
-                            'file': str(file_path),
-                            'line': symbol.line,
-                        }
-                    )
-
-            for ref in references:
-                source_id = ref.source_id if ref.source_id.startswith("js_") else f"js_{ref.source_id}"
-                target_id = ref.target_id if ref.target_id.startswith("js_") else f"js_{ref.target_id}"
-                self.symbol_table.add_reference(
-                    source_id=source_id,
-                    target_id=target_id,
-                    reference_type=ref.type,
-                    line=ref.line,
-                    column=ref.column,
-                    context=ref.context,
+        signatures = {path: _file_signature(path) for path in js_files}
+        changed = _changed_files(self.symbol_table, js_files, signatures) if self.skip_unchanged else js_files
+        self._stats["js_unchanged_files"] = len(js_files) - len(changed)
+
+        for idx, (file_path, symbols, references) in enumerate(self._iter_parsed(changed), 1):
+            file_str = str(file_path)
+            self.symbol_table.clear_file_symbols(file_str)
+            self.symbol_table.add_symbols(self._iter_symbols(file_str, symbols))
+            self.symbol_table.add_references(
+                (
+                    source_id if source_id.startswith("js_") else f"js_{source_id}",
+                    target_id if target_id.startswith("js_") else f"js_{target_id}",
+                    ref_type,
+                    line,
+                    column,
+                    context,
                 )
+                for source_id, target_id, ref_type, line, column, context in references
+            )
+            if signatures[file_path] is not None:
+                self.symbol_table.update_file_hash(file_str, signatures[file_path])
 
             total_symbols += len(symbols)
             total_references += len(references)
 
             if idx % 100 == 0:
-                logger.debug("Processed JS symbols for %s/%s files", idx, len(js_files))
+                logger.debug("Processed JS symbols for %s/%s files", idx, len(changed))
 
         self.symbol_table.conn.commit()
         self._stats["js_symbols"] = total_symbols
@@ -332,12 +481,44 @@ class JavaScriptLanguageModule:
     def stats(self) -> Dict[str, int]:
         return dict(self._stats)
 
+    def _iter_symbols(self, file_str: str, symbols: List[_SymbolRow]) -> Iterator[Symbol]:
+        """Stream table symbols for one file's rows, noting API calls on the way."""
+        for raw_id, name, js_type, line, column, metadata in symbols:
+            symbol_id = f"js_{raw_id}"
+            yield Symbol(
+                id=symbol_id,
+                name=name,
+                type=self._map_symbol_type(js_type),
+                file_path=file_str,
+                line_number=line,
+                column_number=column,
+                namespace=None,
+                parent_id=None,
+                metadata={"js_type": js_type, "js_metadata": metadata},
+            )
+
+            if js_type == 'api_call':
+                self.api_calls.append(
+                    {
+                        'symbol_id': symbol_id,
+                        'endpoint': metadata.get('endpoint'),
+                        'method': metadata.get('method'),
+                        'php_controller': metadata.get('php_controller'),
+                        'php_method': metadata.get('php_method'),
+                        'file': file_str,
+                        'line': line,
+                    }
+                )
+
+    def _iter_parsed(self, js_files: List[Path]) -> Iterator[Tuple[Path, List[_SymbolRow], List[_ReferenceRow]]]:
+        return _iter_parsed_rows(self.parser, js_files, self.max_workers, self.min_parallel_files, "JS")
+
     def _discover_files(self) -> List[Path]:
-        patterns = ["*.js", "*.jsx", "*.mjs", "*.ts", "*.tsx"]
-        files: List[Path] = []
-        for pattern in patterns:
-            files.extend(self.project_root.rglob(pattern))
-        return [f for f in files if "node_modules" not in f.parts and "vendor" not in f.parts]
+        return discover_files(
+            self.project_root,
+            (".js", ".jsx", ".mjs", ".ts", ".tsx"),
+            frozenset({"node_modules", "vendor"}),
+        )
 
     def _map_symbol_type(self, js_type: str) -> SymbolType:
         mapping = {
@@ -361,6 +542,9 @@ class PythonLanguageModule:
     _stats: Dict[str, int] = field(default_factory=dict)
     parser: PythonParser = field(default_factory=PythonParser)
     processed_files: List[Path] = field(default_factory=list)
+    max_workers: Optional[int] = None
+    min_parallel_files: int = 32
+    skip_unchanged: bool = True
 
     def collect(self) -> None:
         """Collect Python symbols"""
@@ -371,43 +555,47 @@ class PythonLanguageModule:
         total_references = 0
         self.processed_files = list(py_files)
 
-        for idx, file_path in enumerate(py_files, 1):
-            try:
-                symbols, references = self.parser.parse_file(str(file_path))
-            except Exception as exc:  # pragma: no cover - passthrough logging
-                logger.debug("Python parse failed for %s: %s", file_path, exc)
-                continue
-
-            for symbol in symbols:
-                symbol_id = f"py_{symbol.id}"
-                sym = Symbol(
-                    id=symbol_id,
-                    name=symbol.name,
-                    type=self._map_symbol_type(symbol.type),
-                    file_path=str(file_path),
-                    line_number=symbol.line,
-                    column_number=symbol.column,
+        signatures = {path: _file_signature(path) for path in py_files}
+        changed = _changed_files(self.symbol_table, py_files, signatures) if self.skip_unchanged else py_files
+        self._stats["python_unchanged_files"] = len(py_files) - len(changed)
+
+        for idx, (file_path, symbols, references) in enumerate(self._iter_parsed(changed), 1):
+            file_str = str(file_path)
+            self.symbol_table.clear_file_symbols(file_str)
+            self.symbol_table.add_symbols(
+                Symbol(
+                    id=f"py_{raw_id}",
+                    name=name,
+                    type=self._map_symbol_type(py_type),
+                    file_path=file_str,
+                    line_number=line,
+                    column_number=column,
                     namespace=None,
                     parent_id=None,
-                    metadata={"python_type": symbol.type, "python_metadata": symbol.metadata},
+                    metadata={"python_type": py_type, "python_metadata": metadata},
                 )
-                self.symbol_table.add_symbol(sym)
+                for raw_id, name, py_type, line, column, metadata in symbols
+            )
 
-            for ref in references:
-                self.symbol_table.add_reference(
-                    source_id=f"py_{ref.source_id}" if not ref.source_id.startswith('py_') else ref.source_id,
-                    target_id=f"py_{ref.target_id}" if not ref.target_id.startswith('py_') else ref.target_id,
-                    reference_type=ref.type,
-                    line=ref.line,
-                    column=ref.column,
-                    context=ref.context,
+            self.symbol_table.add_references(
+                (
+                    f"py_{source_id}" if not source_id.startswith('py_') else source_id,
+                    f"py_{target_id}" if not target_id.startswith('py_') else target_id,
+                    ref_type,
+                    line,
+                    column,
+                    context,
                 )
+                for source_id, target_id, ref_type, line, column, context in references
+            )
+            if signatures[file_path] is not None:
+                self.symbol_table.update_file_hash(file_str, signatures[file_path])
 
             total_symbols += len(symbols)
             total_references += len(references)
 
             if idx % 100 == 0:
-                logger.debug("Processed Python symbols for %s/%s files", idx, len(py_files))
+                logger.debug("Processed Python symbols for %s/%s files", idx, len(changed))
 
         self.symbol_table.conn.commit()
         self._stats["python_symbols"] = total_symbols
@@ -420,11 +608,16 @@ class PythonLanguageModule:
     def stats(self) -> Dict[str, int]:
         return dict(self._stats)
 
+    def _iter_parsed(self, py_files: List[Path]) -> Iterator[Tuple[Path, List[_SymbolRow], List[_ReferenceRow]]]:
+        return _iter_parsed_rows(self.parser, py_files, self.max_workers, self.min_parallel_files, "Python")
+
     def _discover_files(self) -> List[Path]:
         """Find all Python files in project"""
-        files = list(self.project_root.rglob("*.py"))
-        # Filter out common directories
-        return [f for f in files if not any(part in f.parts for part in ["__pycache__", "venv", "env", ".venv", "node_modules", "vendor"])]
+        return discover_files(
+            self.project_root,
+            (".py",),
+            frozenset({"__pycache__", "venv", "env", ".venv", "node_modules", "vendor"}),
+        )
 
     def _map_symbol_type(self, py_type: str) -> SymbolType:
         """Map Python symbol types to SymbolType enum"""
@@ -162,11 +162,13 @@ class ModuleAnalysis:
 class _TreeSitterLoader:
     """Lazily loads TypeScript/TSX grammars from the bundled languages."""
 
+    # Grammars are immutable once loaded, so every loader in the process shares them.
+    _languages: Dict[str, Language] = {}
+
     def __init__(self) -> None:
         package_dir = Path(tree_sitter_languages.__file__).resolve().parent
         self._library_path = package_dir / "languages.so"
         self._lib = cdll.LoadLibrary(str(self._library_path))
-        self._languages: Dict[str, Language] = {}
         self._parsers: Dict[str, Parser] = {}
 
     def parser_for_suffix(self, suffix: str) -> Optional[Parser]:
@@ -430,11 +432,11 @@ class TypeScriptAnalyzer:
 
         class_body = node.child_by_field_name("body")
         if class_body:
-            class_info.jsx = self._collect_jsx_usages(class_body)
+            class_info.jsx, has_jsx = self._scan_jsx(class_body)
             class_info.is_component = any(
                 name.startswith("React.Component") or name.endswith("Component")
                 for name in class_info.extends
-            ) or self._contains_jsx(class_body)
+            ) or has_jsx
 
         self._analysis.classes.append(class_info)
 
@@ -533,13 +535,16 @@ class TypeScriptAnalyzer:
             "arrow_function": "arrow",
         }.get(node.type, kind)
 
+        # Modifier tokens are direct children; scan them once rather than per flag.
+        child_types = {child.type for child in node.children}
+
         return TSFunction(
             name=name,
             location=loc,
             export_type=export_ctx,
             is_default_export=export_ctx == "default",
-            is_async=self._has_child(node, "async"),
-            is_generator=self._has_child(node, "*") or self._has_child(node, "yield"),
+            is_async="async" in child_types,
+            is_generator="*" in child_types or "yield" in child_types,
             return_type=return_type,
             calls=calls,
             hooks=hooks,
@@ -608,7 +613,7 @@ class TypeScriptAnalyzer:
         jsx: Dict[str, JSXRender] = {}
         state: Dict[str, ComponentState] = {}
 
-        def visit(node: Node) -> None:
+        def visit(node: Node, in_jsx: bool) -> None:
             if node.type in {"function_declaration", "arrow_function", "function", "method_definition"} and node is not body:
                 # Avoid descending into nested function bodies; they will be handled separately.
                 return
@@ -616,18 +621,24 @@ class TypeScriptAnalyzer:
             if node.type == "call_expression":
                 function_node = node.child_by_field_name("function")
                 name = self._expression_to_string(function_node)
-                if name:
-                    calls.setdefault(name, CallSite(name=name, location=self._loc(node)))
+                # Only the first occurrence is kept, so build records for new names only.
+                if name and name not in calls:
+                    location = self._loc(node)
+                    calls[name] = CallSite(name=name, location=location)
                     hook_name = name.split(".")[-1]
-                    if hook_name.startswith("use") and len(hook_name) > 3 and hook_name[3].isupper():
-                        hooks.setdefault(
-                            hook_name,
-                            HookUsage(name=hook_name, location=self._loc(node)),
-                        )
-
-            if node.type in {"jsx_element", "jsx_self_closing_element", "jsx_fragment"}:
+                    if (
+                        hook_name not in hooks
+                        and hook_name.startswith("use")
+                        and len(hook_name) > 3
+                        and hook_name[3].isupper()
+                    ):
+                        hooks[hook_name] = HookUsage(name=hook_name, location=location)
+
+            if not in_jsx and node.type in {"jsx_element", "jsx_self_closing_element", "jsx_fragment"}:
+                # One scan of the outermost JSX tree covers every nested element.
                 for render in self._collect_jsx_usages(node):
                     jsx.setdefault(render.name, render)
+                in_jsx = True
 
             if node.type == "lexical_declaration":
                 for declarator in node.named_children:
@@ -646,39 +657,44 @@ class TypeScriptAnalyzer:
                             state_name = self._text(state_name_node)
                         else:
                             state_name = self._text(pattern)
-                        state.setdefault(
-                            state_name,
-                            ComponentState(
+                        if state_name not in state:
+                            state[state_name] = ComponentState(
                                 name=state_name,
                                 hook=call_name.split(".")[-1],
                                 location=self._loc(pattern),
-                            ),
-                        )
+                            )
 
             for child in node.children:
-                visit(child)
+                visit(child, in_jsx)
 
-        visit(body)
+        visit(body, False)
 
         return (list(calls.values()), list(hooks.values()), list(jsx.values()), list(state.values()))
 
     def _collect_jsx_usages(self, node: Node) -> List[JSXRender]:
+        return self._scan_jsx(node)[0]
+
+    def _scan_jsx(self, node: Node) -> Tuple[List[JSXRender], bool]:
+        """Collect JSX usages and report whether any JSX appears, in a single walk."""
         jsx_usages: Dict[str, JSXRender] = {}
+        has_jsx = False
 
         def visit(n: Node) -> None:
+            nonlocal has_jsx
+            if n.type in {"jsx_element", "jsx_self_closing_element", "jsx_fragment"}:
+                has_jsx = True
             if n.type in {"jsx_opening_element", "jsx_self_closing_element"}:
                 name_node = n.child_by_field_name("name")
                 if name_node is None:
                     return
                 name = self._jsx_name(name_node)
-                is_component = bool(name) and name[0].isupper()
-                if name:
-                    jsx_usages.setdefault(name, JSXRender(name=name, location=self._loc(n), is_component=is_component))
+                if name and name not in jsx_usages:
+                    jsx_usages[name] = JSXRender(name=name, location=self._loc(n), is_component=name[0].isupper())
             for child in n.children:
                 visit(child)
 
         visit(node)
-        return list(jsx_usages.values())
+        return list(jsx_usages.values()), has_jsx
 
     def _extract_props(self, node: Node) -> Tuple[Optional[str], List[ComponentProp]]:
         params = node.child_by_field_name("parameters")
@@ -790,22 +806,6 @@ class TypeScriptAnalyzer:
             return self._expression_to_string(node.child_by_field_name("function"))
         return self._text(node)
 
-    def _contains_jsx(self, node: Node) -> bool:
-        found = False
-
-        def visit(n: Node) -> None:
-            nonlocal found
-            if found:
-                return
-            if n.type in {"jsx_element", "jsx_self_closing_element", "jsx_fragment"}:
-                found = True
-                return
-            for child in n.children:
-                visit(child)
-
-        visit(node)
-        return found
-
     def _has_child(self, node: Node, needle: str) -> bool:
         return any(child.type == needle for child in node.children)
 
@@ -842,7 +842,8 @@ class TypeScriptAnalyzer:
         if node is None:
             return False
         if node.type in {"function", "arrow_function"}:
-            return any(child.type == "async" for child in node.children)
+            first_token = node.child(0)
+            return first_token is not None and first_token.type == "async"
         if node.type == "call_expression":
             arguments = node.child_by_field_name("arguments")
             if arguments:
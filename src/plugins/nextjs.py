@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from os import walk as os_walk
 
+from src.core.hashing import file_symbol_id, stable_hash
 from src.core.symbol_table import Symbol, SymbolTable, SymbolType
 from src.pipeline.typescript import ModuleAnalysis, TypeScriptAnalyzer
 from src.plugins.base import PipelinePlugin, PluginContext
@@ -16,11 +17,29 @@ from src.plugins.base import PipelinePlugin, PluginContext
 logger = logging.getLogger(__name__)
 
 
+_worker_analyzer: Optional[TypeScriptAnalyzer] = None
+
+
+def _init_ts_worker() -> None:
+    """Build one analyzer per worker process so grammar loading is paid once, not per file."""
+    global _worker_analyzer
+    _worker_analyzer = TypeScriptAnalyzer()
+
+
+def _analyze_ts_file(task: Tuple[Path, Path]) -> Optional[ModuleAnalysis]:
+    """Analyze a single file; module-level so worker processes can pickle it."""
+    path, project_root = task
+    analyzer = _worker_analyzer or TypeScriptAnalyzer()
+    return analyzer.analyze(path, project_root)
+
+
 class NextJsPlugin(PipelinePlugin):
     name = "nextjs"
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None, min_parallel_files: int = 32) -> None:
         self._analyzer = TypeScriptAnalyzer()
+        self.max_workers = max_workers
+        self.min_parallel_files = min_parallel_files
 
     # ------------------------------------------------------------------
     # Plugin lifecycle
@@ -45,8 +64,7 @@ class NextJsPlugin(PipelinePlugin):
         relationships_total = 0
 
         files = list(self._discover_ts_files(project_root))
-        for ts_path in files:
-            analysis = self._analyzer.analyze(ts_path, project_root)
+        for analysis in self._iter_analyses(files, project_root):
             if analysis is None:
                 continue
 
@@ -871,14 +889,26 @@ class NextJsPlugin(PipelinePlugin):
     # Discovery helpers
     # ------------------------------------------------------------------
 
+    def _iter_analyses(self, files: List[Path], project_root: Path) -> Iterator[Optional[ModuleAnalysis]]:
+        """Yield one analysis per file, fanning out to a process pool for large batches."""
+        if self.max_workers == 1 or len(files) < self.min_parallel_files:
+            for ts_path in files:
+                yield self._analyzer.analyze(ts_path, project_root)
+            return
+
+        tasks = [(ts_path, project_root) for ts_path in files]
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_ts_worker) as executor:
+            yield from executor.map(_analyze_ts_file, tasks, chunksize=16)
+
     def _discover_ts_files(self, root: Path) -> Iterable[Path]:
-        exts = {".ts", ".tsx"}
+        exts = (".ts", ".tsx")
         skip_dirs = {"node_modules", ".next", "dist", "build", "out"}
         for current_root, dirs, files in os_walk(root):
             dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith(".")]
+            base = Path(current_root)
             for filename in files:
-                if Path(filename).suffix.lower() in exts:
-                    yield Path(current_root) / filename
+                if filename.lower().endswith(exts):
+                    yield base / filename
 
     # ------------------------------------------------------------------
     # Small utilities
@@ -951,9 +981,8 @@ class NextJsPlugin(PipelinePlugin):
 
     @staticmethod
     def _make_symbol_id(prefix: str, path: Path, name: str, line: int, column: int) -> str:
-        raw = f"{path}:{name}:{line}:{column}:{prefix}".encode()
-        return f"next_{prefix}_{hashlib.md5(raw).hexdigest()}"
+        return f"next_{prefix}_{stable_hash(f'{path}:{name}:{line}:{column}:{prefix}')}"
 
     @staticmethod
     def _file_symbol_id(path: Path) -> str:
-        return f"file_{hashlib.md5(str(path).encode()).hexdigest()}"
+        return file_symbol_id(path)
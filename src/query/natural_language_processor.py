@@ -12,6 +12,8 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_IDENTIFIER_RE = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+
 
 class NaturalLanguageProcessor:
     """Process natural language queries against code graph"""
@@ -184,6 +186,16 @@ class NaturalLanguageProcessor:
             'error': ['error', 'exception', 'throw', 'catch', 'handle', 'fail'],
             'validate': ['validate', 'validation', 'sanitize', 'filter', 'check', 'verify']
         }
+
+        # Compile the patterns once instead of on every query
+        self._compiled_patterns = [
+            (
+                re.compile(pattern),
+                re.compile(config['extract_param']) if 'extract_param' in config else None,
+                config,
+            )
+            for pattern, config in self.query_patterns.items()
+        ]
     
     def process_query(self, natural_query: str) -> Dict:
         """Process a natural language query and return results"""
@@ -192,11 +204,11 @@ class NaturalLanguageProcessor:
         logger.info(f"Processing query: {natural_query}")
         
         # Try to match query patterns
-        for pattern, config in self.query_patterns.items():
-            if re.search(pattern, natural_query):
+        for pattern, param_pattern, config in self._compiled_patterns:
+            if pattern.search(natural_query):
                 if 'cypher_template' in config:
                     # Extract parameter and fill template
-                    param_match = re.search(config['extract_param'], natural_query)
+                    param_match = param_pattern.search(natural_query)
                     if param_match:
                         target = param_match.group(2)
                         cypher = config['cypher_template'].replace('{target}', target)
@@ -232,7 +244,7 @@ class NaturalLanguageProcessor:
                     break
         
         # Extract potential code identifiers (camelCase, snake_case, etc.)
-        identifiers = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', query)
+        identifiers = _IDENTIFIER_RE.findall(query)
         keywords.extend([id for id in identifiers if len(id) > 2])
         
         return list(set(keywords))
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import sqlite3
@@ -13,6 +12,7 @@ from typing import Dict, Iterable, List, Optional, Tuple
 from neo4j import GraphDatabase
 from neo4j.exceptions import Neo4jError, ServiceUnavailable
 
+from src.core.hashing import stable_hash
 from src.pipeline import PipelineConfig, Neo4jConfig
 
 logger = logging.getLogger(__name__)
@@ -125,7 +125,7 @@ def _make_relative(path_obj: Path, project_root: Path) -> str:
 
 
 def _hash_id(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()
+    return stable_hash(text)
 
 
 def _write_directory_nodes(file, directories: Dict[str, str]) -> None:
@@ -0,0 +1,43 @@
+"""Tests for how JS API endpoints are split before matching PHP actions."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.pipeline.endpoints import ACTION_METHOD_RE, API_ENDPOINT_RE, CONTROLLER_NAME_RE
+
+
+def _groups(endpoint):
+    match = API_ENDPOINT_RE.match(endpoint)
+    return match.groups() if match else None
+
+
+def test_action_segment_is_dropped():
+    assert _groups("Lead/action/convert") == ("Lead", "convert")
+    assert _groups("/api/v1/Lead/action/convert?x=1") == ("Lead", "convert")
+    assert _groups("Lead/action/convert/") == ("Lead", "convert")
+
+
+def test_entity_and_action_without_prefix():
+    assert _groups("Lead/convert") == ("Lead", "convert")
+    assert _groups("Lead") == ("Lead", None)
+    assert _groups("Lead/?x=1") == ("Lead", None)
+
+
+def test_segments_starting_with_action_are_kept_whole():
+    assert _groups("Lead/actions") == ("Lead", "actions")
+    assert _groups("Lead/actionList") == ("Lead", "actionList")
+    assert _groups("Lead/action") == ("Lead", "action")
+
+
+def test_deeper_paths_do_not_match():
+    assert _groups("Lead/123/stream") is None
+    assert _groups("Lead/action/convert/extra") is None
+
+
+def test_controller_and_action_names():
+    assert CONTROLLER_NAME_RE.search("Espo\\Controllers\\LeadController").group(1) == "Lead"
+    assert CONTROLLER_NAME_RE.search("LeadController").group(1) == "Lead"
+    assert ACTION_METHOD_RE.match("actionConvert").group(1) == "Convert"
+    assert ACTION_METHOD_RE.match("convert") is None
@@ -0,0 +1,85 @@
+"""Tests for the Next.js plugin's TypeScript scan."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("tree_sitter_languages")
+
+from src.core.symbol_table import SymbolTable
+from src.pipeline import PipelineConfig
+
+
+PAGE_SOURCE = """
+import React from 'react';
+import { fetchItems } from '../lib/api';
+
+export interface Item { id: number }
+
+export default function Page{idx}() {
+  fetchItems();
+  return <List />;
+}
+"""
+
+ROUTE_SOURCE = """
+export async function GET() {
+  return Response.json({ ok: true });
+}
+"""
+
+
+@pytest.fixture
+def nextjs(monkeypatch):
+    """Load the plugin modules by path: the ``src.plugins`` package ``__init__``
+    imports plugins that are not part of this checkout."""
+
+    def load(name):
+        spec = importlib.util.spec_from_file_location(name, ROOT / (name.replace(".", "/") + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        # Registered so worker processes can unpickle the pool's task function.
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    base = load("src.plugins.base")
+    return base, load("src.plugins.nextjs")
+
+
+def _write_app(root: Path, pages: int) -> None:
+    for idx in range(pages):
+        page_dir = root / "app" / f"page{idx}"
+        page_dir.mkdir(parents=True)
+        (page_dir / "page.tsx").write_text(PAGE_SOURCE.replace("{idx}", str(idx)))
+    route_dir = root / "app" / "api" / "items"
+    route_dir.mkdir(parents=True)
+    (route_dir / "route.ts").write_text(ROUTE_SOURCE)
+
+
+def test_nextjs_scan_parallel_matches_sequential(tmp_path, nextjs):
+    base, plugin_module = nextjs
+    _write_app(tmp_path, 3)
+
+    def scan(**options):
+        table = SymbolTable(":memory:")
+        context = base.PluginContext(
+            config=PipelineConfig.from_dict({}, tmp_path),
+            project_root=tmp_path,
+            symbol_table=table,
+            modules=[],
+            stats={},
+        )
+        plugin_module.NextJsPlugin(**options).after_collect(context)
+        symbols = sorted(tuple(row) for row in table.conn.execute("SELECT * FROM symbols"))
+        references = sorted(tuple(row) for row in table.conn.execute("SELECT * FROM symbol_references"))
+        return context.stats, symbols, references
+
+    sequential = scan(max_workers=1)
+    assert sequential[0]["next_ts_files"] == 4
+    assert sequential[0]["next_api_routes"] == 1
+    assert scan(max_workers=2, min_parallel_files=1) == sequential
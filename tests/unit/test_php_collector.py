@@ -0,0 +1,98 @@
+"""Tests for the PHP symbol collector (pass 1)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.core.hashing import stable_hash
+from src.core.symbol_table import SymbolTable, SymbolType
+from parsers.php_enhanced import PHPSymbolCollector
+
+
+PHP_SOURCE = """<?php
+namespace App\\Service;
+
+use App\\Contracts\\Greeter;
+
+interface Named {}
+
+class Hello extends Base implements Greeter, Named
+{
+    public const VERSION = '1.0';
+    private static ?string $name = null;
+
+    public function greet(string $who, int ...$times): string
+    {
+        return "Hello $who";
+    }
+}
+
+function helper($value = 1) {}
+"""
+
+
+def _collect(tmp_path: Path) -> dict:
+    source = tmp_path / "Hello.php"
+    source.write_text(PHP_SOURCE)
+    table = SymbolTable(":memory:")
+    PHPSymbolCollector(table).parse_file(str(source))
+    return {symbol.name: symbol for symbol in table.get_symbols_in_file(str(source))}
+
+
+def test_collects_declarations_with_namespace(tmp_path):
+    symbols = _collect(tmp_path)
+
+    hello = symbols["App\\Service\\Hello"]
+    assert hello.type == SymbolType.CLASS
+    assert hello.extends == "Base"
+    assert hello.implements == ["Greeter", "Named"]
+    assert symbols["App\\Service\\Named"].type == SymbolType.INTERFACE
+    assert symbols["App\\Service"].type == SymbolType.NAMESPACE
+
+    for member in ("greet", "VERSION", "name"):
+        assert symbols[member].parent_id == hello.id
+
+
+def test_collects_method_and_function_details(tmp_path):
+    symbols = _collect(tmp_path)
+
+    greet = symbols["greet"]
+    assert greet.type == SymbolType.METHOD
+    assert greet.visibility == "public"
+    assert greet.return_type == "string"
+    assert [param["name"] for param in greet.parameters] == ["who", "times"]
+    assert greet.parameters[1]["variadic"] is True
+
+    prop = symbols["name"]
+    assert prop.is_static
+    assert prop.visibility == "private"
+
+    helper = symbols["App\\Service\\helper"]
+    assert helper.type == SymbolType.FUNCTION
+    assert [param["name"] for param in helper.parameters] == ["value"]
+    assert helper.parameters[0]["optional"] is True
+    assert greet.parameters[0]["optional"] is False
+
+
+def test_symbol_ids_hash_file_and_position(tmp_path):
+    symbols = _collect(tmp_path)
+
+    hello = symbols["App\\Service\\Hello"]
+    source = tmp_path / "Hello.php"
+    expected = stable_hash(f"{source}:{hello.line_number - 1}:{hello.column_number}:class_declaration")
+    assert hello.id == f"php_class_{expected}"
+
+
+def test_iter_symbols_streams_in_document_order_without_a_table(tmp_path):
+    stored = _collect(tmp_path)
+    collector = PHPSymbolCollector(None)
+
+    streamed = collector.iter_symbols("Hello.php", PHP_SOURCE.encode())
+    first = next(streamed)
+    assert first.type == SymbolType.NAMESPACE
+
+    rest = list(streamed)
+    assert len(rest) + 1 == len(stored)
+    lines = [first.line_number] + [symbol.line_number for symbol in rest]
+    assert lines == sorted(lines)
@@ -0,0 +1,38 @@
+"""Tests for the PHP reference resolver (pass 2)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.core.symbol_table import SymbolTable
+from parsers.php_enhanced import PHPSymbolCollector
+from parsers.php_reference_resolver import PHPReferenceResolver
+
+
+def _write(tmp_path: Path, name: str, source: str) -> str:
+    path = tmp_path / name
+    path.write_text(source)
+    return str(path)
+
+
+def test_unresolved_import_creates_one_external_symbol(tmp_path):
+    files = [
+        _write(tmp_path, f"{cls}.php", f"<?php\nnamespace App;\n\nuse Vendor\\Missing;\n\nclass {cls} {{}}\n")
+        for cls in ("First", "Second")
+    ]
+    table = SymbolTable(":memory:")
+    collector = PHPSymbolCollector(table)
+    resolver = PHPReferenceResolver(table)
+    for path in files:
+        collector.parse_file(path)
+    for path in files:
+        resolver.resolve_file(path)
+
+    externals = table.conn.execute("SELECT id FROM symbols WHERE id LIKE 'external_%'").fetchall()
+    assert len(externals) == 1
+
+    targets = table.conn.execute(
+        "SELECT target_id FROM symbol_references WHERE reference_type = 'IMPORTS'"
+    ).fetchall()
+    assert [row[0] for row in targets] == [externals[0][0]] * 2
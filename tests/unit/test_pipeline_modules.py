@@ -0,0 +1,215 @@
+"""Tests for the language modules used by the indexing pipeline."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.core.hashing import file_symbol_id
+from src.core.symbol_table import Symbol, SymbolTable, SymbolType
+from src.pipeline.indexer import JavaScriptLanguageModule, PHPLanguageModule, PythonLanguageModule
+
+
+JS_SOURCE = """
+class Widget {
+  render() { return 1; }
+}
+function helper() {}
+const answer = 42;
+"""
+
+
+def _write_js_files(root: Path, count: int) -> None:
+    for idx in range(count):
+        (root / f"module_{idx}.js").write_text(JS_SOURCE)
+
+
+def _collect(root: Path, **options) -> dict:
+    module = JavaScriptLanguageModule(root, SymbolTable(":memory:"), **options)
+    module.collect()
+    return module.stats()
+
+
+def test_javascript_collect_parallel_matches_sequential(tmp_path):
+    _write_js_files(tmp_path, 4)
+
+    sequential = _collect(tmp_path, max_workers=1)
+    parallel = _collect(tmp_path, max_workers=2, min_parallel_files=1)
+
+    assert sequential["js_files"] == 4
+    assert sequential["js_symbols"] == 4 * 4
+    assert parallel == sequential
+
+
+def test_python_collect_stores_references(tmp_path):
+    (tmp_path / "app.py").write_text(
+        "import os\n\nclass Base:\n    pass\n\nclass Child(Base):\n    def run(self):\n        os.getcwd()\n"
+    )
+    table = SymbolTable(":memory:")
+    module = PythonLanguageModule(tmp_path, table)
+    module.collect()
+
+    stored = table.get_stats()["total_references"]
+    assert module.stats()["python_references"] > 0
+    assert stored == module.stats()["python_references"]
+
+
+def test_python_collect_parallel_matches_sequential(tmp_path):
+    for idx in range(3):
+        (tmp_path / f"mod_{idx}.py").write_text("import os\n\nclass Thing:\n    def run(self):\n        os.getcwd()\n")
+
+    def collect(**options):
+        module = PythonLanguageModule(tmp_path, SymbolTable(":memory:"), **options)
+        module.collect()
+        return module.stats()
+
+    sequential = collect(max_workers=1)
+    assert sequential["python_symbols"] > 0
+    assert collect(max_workers=2, min_parallel_files=1) == sequential
+
+
+def test_python_parser_queries_statements_around_syntax_errors(tmp_path):
+    from parsers.python_parser import PythonParser
+
+    source = tmp_path / "broken.py"
+    source.write_text("import os\n)\nos.getcwd()\n")
+
+    symbols, references = PythonParser().parse_file(str(source))
+
+    assert [symbol.name for symbol in symbols] == ["os"]
+    assert [reference.context for reference in references] == ["Calls os.getcwd"]
+
+
+def test_parsers_share_compiled_queries_until_cleared():
+    from parsers import js_parser, python_parser
+
+    for module, parser_class in (
+        (js_parser, js_parser.JavaScriptParser),
+        (python_parser, python_parser.PythonParser),
+    ):
+        first = parser_class()._query
+        assert parser_class()._query is first
+        module.clear_query_cache()
+        assert parser_class()._query is not first
+
+
+def test_javascript_discovery_prunes_excluded_directories(tmp_path):
+    _write_js_files(tmp_path, 1)
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "dep.js").write_text(JS_SOURCE)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "view.jsx").write_text(JS_SOURCE)
+    (tmp_path / "src" / "notes.txt").write_text("")
+
+    module = JavaScriptLanguageModule(tmp_path, SymbolTable(":memory:"))
+    found = sorted(path.relative_to(tmp_path).as_posix() for path in module._discover_files())
+
+    assert found == ["module_0.js", "src/view.jsx"]
+
+
+def test_javascript_collect_skips_unchanged_files(tmp_path):
+    _write_js_files(tmp_path, 2)
+    table = SymbolTable(":memory:")
+
+    first = JavaScriptLanguageModule(tmp_path, table)
+    first.collect()
+    assert first.stats()["js_symbols"] == 2 * 4
+
+    second = JavaScriptLanguageModule(tmp_path, table)
+    second.collect()
+    assert second.stats()["js_unchanged_files"] == 2
+    assert second.stats()["js_symbols"] == 0
+
+    (tmp_path / "module_0.js").write_text("function onlyOne() {}\n")
+    third = JavaScriptLanguageModule(tmp_path, table)
+    third.collect()
+    assert third.stats()["js_unchanged_files"] == 1
+    assert [s.name for s in table.get_symbols_in_file(str(tmp_path / "module_0.js"))] == ["onlyOne"]
+
+
+def _add_file_node(table: SymbolTable, path: Path) -> None:
+    """Stand in for the structure pass, which writes FILE nodes before collection."""
+    table.add_symbol(
+        Symbol(
+            id=file_symbol_id(str(path)),
+            name=path.name,
+            type=SymbolType.FILE,
+            file_path=str(path),
+            line_number=0,
+            column_number=0,
+        )
+    )
+
+
+def test_javascript_collect_keeps_file_node(tmp_path):
+    source = tmp_path / "app.js"
+    source.write_text("function helper() {}\n")
+    table = SymbolTable(":memory:")
+    _add_file_node(table, source)
+
+    JavaScriptLanguageModule(tmp_path, table).collect()
+
+    types = {s.type for s in table.get_symbols_in_file(str(source))}
+    assert types == {SymbolType.FILE, SymbolType.FUNCTION}
+
+
+def test_python_collect_keeps_file_node(tmp_path):
+    source = tmp_path / "app.py"
+    source.write_text("def helper():\n    pass\n")
+    table = SymbolTable(":memory:")
+    _add_file_node(table, source)
+
+    PythonLanguageModule(tmp_path, table).collect()
+
+    types = {s.type for s in table.get_symbols_in_file(str(source))}
+    assert types == {SymbolType.FILE, SymbolType.FUNCTION}
+
+
+def test_python_collect_skips_unchanged_files(tmp_path):
+    source = tmp_path / "app.py"
+    source.write_text("def first():\n    pass\n")
+    table = SymbolTable(":memory:")
+
+    PythonLanguageModule(tmp_path, table).collect()
+    second = PythonLanguageModule(tmp_path, table)
+    second.collect()
+    assert second.stats()["python_unchanged_files"] == 1
+    assert second.stats()["python_symbols"] == 0
+
+    source.write_text("def second():\n    pass\n")
+    PythonLanguageModule(tmp_path, table).collect()
+    assert [s.name for s in table.get_symbols_in_file(str(source))] == ["second"]
+
+
+def test_php_collect_parallel_matches_sequential(tmp_path):
+    for idx in range(3):
+        (tmp_path / f"Service{idx}.php").write_text(
+            f"<?php\nnamespace App;\n\nclass Service{idx} {{\n    public function run(int $n = 1) {{}}\n}}\n"
+        )
+
+    def collect(**options):
+        table = SymbolTable(":memory:")
+        PHPLanguageModule(tmp_path, table, **options).collect()
+        return sorted(tuple(row) for row in table.conn.execute("SELECT * FROM symbols"))
+
+    sequential = collect(max_workers=1)
+    assert len(sequential) >= 3 * 3
+    assert collect(max_workers=2, min_parallel_files=1) == sequential
+
+
+def test_php_collect_parallel_skips_unchanged_files(tmp_path):
+    for idx in range(2):
+        (tmp_path / f"Service{idx}.php").write_text(f"<?php\nclass Service{idx} {{}}\n")
+    table = SymbolTable(":memory:")
+    options = {"max_workers": 2, "min_parallel_files": 1}
+    PHPLanguageModule(tmp_path, table, **options).collect()
+    before = table.get_file_hashes()
+
+    changed = tmp_path / "Service0.php"
+    changed.write_text("<?php\nclass Renamed {}\n")
+    PHPLanguageModule(tmp_path, table, **options).collect()
+
+    after = table.get_file_hashes()
+    assert after[str(tmp_path / "Service1.php")] == before[str(tmp_path / "Service1.php")]
+    assert after[str(changed)] != before[str(changed)]
+    assert [s.name for s in table.get_symbols_in_file(str(changed))] == ["Renamed"]
@@ -0,0 +1,91 @@
+"""Tests for the TypeScript/TSX structural analyzer."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytest.importorskip("tree_sitter_languages")
+
+from src.pipeline.typescript import TypeScriptAnalyzer
+
+
+PAGE_SOURCE = """
+'use client';
+import React, { useState } from 'react';
+import type { Props } from './types';
+
+export default async function Page({ title }: Props) {
+  const [count, setCount] = useState(0);
+  fetchData();
+  fetchData();
+  return (
+    <Layout>
+      <Layout.Header title={title} />
+      <div>{count}</div>
+    </Layout>
+  );
+}
+
+export class Legacy extends React.Component {
+  render() { return <Panel />; }
+}
+
+export interface Shape extends Base { size: number }
+type Alias = string;
+"""
+
+ROUTE_SOURCE = """
+export async function GET(request) { return Response.json({}); }
+export const POST = withAuth(async (request) => Response.json({}));
+export function helper() { return 1; }
+"""
+
+
+def _analyze(tmp_path: Path, relative: str, source: str):
+    path = tmp_path / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source)
+    return TypeScriptAnalyzer().analyze(path, tmp_path)
+
+
+def test_page_component_semantics(tmp_path):
+    analysis = _analyze(tmp_path, "app/dashboard/page.tsx", PAGE_SOURCE)
+
+    assert analysis.is_client_module
+    assert analysis.route_path == "/dashboard"
+    assert [(entry.local_name, entry.kind) for entry in analysis.imports] == [
+        ("React", "default"),
+        ("useState", "named"),
+        ("Props", "named"),
+    ]
+
+    page = analysis.functions[0]
+    assert (page.name, page.is_async, page.is_component, page.export_type) == ("Page", True, True, "default")
+    assert [call.name for call in page.calls] == ["useState", "fetchData"]
+    assert [hook.name for hook in page.hooks] == ["useState"]
+    assert [state.name for state in page.state] == ["count"]
+    assert [render.name for render in page.jsx] == ["Layout", "Layout.Header", "div"]
+    assert [prop.name for prop in page.props] == ["title"]
+
+    legacy = analysis.classes[0]
+    assert legacy.extends == ["React", "Component"]
+    assert legacy.is_component
+    assert [render.name for render in legacy.jsx] == ["Panel"]
+
+    assert analysis.interfaces[0].members == ["size"]
+    assert analysis.type_aliases[0].value == "string"
+
+
+def test_api_route_handlers(tmp_path):
+    analysis = _analyze(tmp_path, "app/api/users/route.ts", ROUTE_SOURCE)
+
+    assert [(route.method, route.is_async) for route in analysis.api_routes] == [
+        ("GET", True),
+        ("POST", True),
+    ]
+    helper = next(func for func in analysis.functions if func.name == "helper")
+    assert not helper.is_async
+    assert not helper.is_generator